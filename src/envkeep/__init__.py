@@ -1,19 +1,23 @@
 """Envkeep public API."""
 
-from importlib import metadata
+from __future__ import annotations
 
-__version__ = metadata.version("envkeep")
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-from .report import (
-    DiffEntry,
-    DiffKind,
-    DiffReport,
-    IssueSeverity,
-    ValidationIssue,
-    ValidationReport,
-)
-from .snapshot import EnvSnapshot
-from .spec import EnvSpec, ProfileSpec, VariableSpec, VariableType
+if TYPE_CHECKING:
+    from .report import (
+        DiffEntry,
+        DiffKind,
+        DiffReport,
+        IssueSeverity,
+        ValidationIssue,
+        ValidationReport,
+    )
+    from .snapshot import EnvSnapshot
+    from .spec import EnvSpec, ProfileSpec, VariableSpec, VariableType
+
+    __version__: str
 
 __all__ = [
     "DiffKind",
@@ -29,3 +33,35 @@ __all__ = [
     "DiffReport",
     "__version__",
 ]
+
+# Public names resolve on first access so ``envkeep.cli`` only pays for what it uses
+_EXPORTS = {
+    "DiffEntry": ".report",
+    "DiffKind": ".report",
+    "DiffReport": ".report",
+    "IssueSeverity": ".report",
+    "ValidationIssue": ".report",
+    "ValidationReport": ".report",
+    "EnvSnapshot": ".snapshot",
+    "EnvSpec": ".spec",
+    "ProfileSpec": ".spec",
+    "VariableSpec": ".spec",
+    "VariableType": ".spec",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        from importlib import metadata
+
+        value: Any = metadata.version("envkeep")
+    elif name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,24 @@
+"""Console entry point that answers ``--version`` before loading the CLI stack."""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Sequence
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = list(sys.argv[1:] if argv is None else argv)
+    if args == ["--version"]:
+        # Same output as the Typer callback, without importing Typer, Click or Rich
+        from . import __version__
+
+        sys.stdout.write(f"envkeep version: {__version__}\n")
+        return
+
+    from .cli import run
+
+    run(args)
+
+
+if __name__ == "__main__":
+    main()
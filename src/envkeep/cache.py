@@ -3,10 +3,14 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import os
+import pickle
+import tempfile
 from pathlib import Path
 
 from . import __version__
 from .report import ValidationReport
+from .spec import EnvSpec
 
 logger = logging.getLogger(__name__)
 
@@ -18,12 +22,36 @@ def _hash_file(path: Path) -> str:
     return hasher.hexdigest()
 
 
+def _replace_text(path: Path, text: str) -> None:
+    """Write ``text`` to ``path`` via a sibling temp file so readers never see a partial file."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(text)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
 class Cache:
     """Manages the caching of validation reports."""
 
     def __init__(self, cache_dir: Path | str = ".envkeep_cache"):
         self._root = Path(cache_dir)
         self._spec_hash_file = self._root / "spec.hash"
+        self._spec_hashes: dict[str, str] = {}
+        # Contents of spec.hash as last read or written by this instance
+        self._stored_spec_hash: str | None = None
+        self._wrote_spec_hash = False
+
+    def _spec_hash(self, spec_path: Path) -> str:
+        # doctor consults the cache once per profile against the same spec
+        key = str(spec_path)
+        cached = self._spec_hashes.get(key)
+        if cached is None:
+            cached = self._spec_hashes[key] = f"{_hash_file(spec_path)}:{__version__}"
+        return cached
 
     def _ensure_dir(self) -> None:
         self._root.mkdir(exist_ok=True)
@@ -36,8 +64,11 @@ class Cache:
             return None
 
         try:
-            cached_spec_hash = self._spec_hash_file.read_text(encoding="utf-8")
-            current_spec_hash = f"{_hash_file(spec_path)}:{__version__}"
+            cached_spec_hash = self._stored_spec_hash
+            if cached_spec_hash is None:
+                cached_spec_hash = self._spec_hash_file.read_text(encoding="utf-8")
+                self._stored_spec_hash = cached_spec_hash
+            current_spec_hash = self._spec_hash(spec_path)
             if cached_spec_hash != current_spec_hash:
                 return None  # Spec has changed, cache is invalid
 
@@ -47,8 +78,8 @@ class Cache:
 
             data = json.loads(profile_cache_file.read_text(encoding="utf-8"))
             return ValidationReport.from_dict(data)
-        except FileNotFoundError:
-            return None  # Cache directory or spec hash file not found
+        except (FileNotFoundError, NotADirectoryError):
+            return None  # Cache directory, spec hash file or profile file not found
         except (OSError, json.JSONDecodeError) as e:
             logger.warning("Failed to read cache: %s", e)
             return None
@@ -57,12 +88,72 @@ class Cache:
         """Cache a validation report."""
         self._ensure_dir()
         try:
-            current_spec_hash = f"{_hash_file(spec_path)}:{__version__}"
-            self._spec_hash_file.write_text(current_spec_hash, encoding="utf-8")
+            current_spec_hash = self._spec_hash(spec_path)
+            if not (self._wrote_spec_hash and self._stored_spec_hash == current_spec_hash):
+                _replace_text(self._spec_hash_file, current_spec_hash)
+                self._stored_spec_hash = current_spec_hash
+                self._wrote_spec_hash = True
 
             profile_cache_file = self._root / f"{_hash_file(profile_path)}.json"
-            profile_cache_file.write_text(json.dumps(report.to_dict()), encoding="utf-8")
+            # doctor reads one profile's entry while another worker writes a shared one
+            _replace_text(profile_cache_file, json.dumps(report.to_dict()))
         except OSError as e:
             # If caching fails, it's not a critical error.
             logger.warning("Failed to write cache: %s", e)
             pass
+
+
+def _spec_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "envkeep"
+
+
+def _spec_cache_entry(spec_path: Path) -> tuple[Path, tuple[int, int, str]] | None:
+    """Return the pickle location for ``spec_path`` and the stamp it must match."""
+    try:
+        resolved = spec_path.resolve()
+        stat = os.stat(resolved)
+    except OSError:
+        return None
+    name = hashlib.sha1(os.fsencode(resolved), usedforsecurity=False).hexdigest()
+    return _spec_cache_dir() / f"spec-{name}.pkl", (stat.st_mtime_ns, stat.st_size, __version__)
+
+
+def load_cached_spec(spec_path: Path) -> EnvSpec | None:
+    """Return the parsed spec pickled for ``spec_path`` if its mtime and size still match."""
+    entry = _spec_cache_entry(spec_path)
+    if entry is None:
+        return None
+    cache_file, stamp = entry
+    try:
+        with cache_file.open("rb") as handle:
+            # Opt-in, user-private cache written only by envkeep itself
+            cached_stamp, spec = pickle.load(handle)  # noqa: S301
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, TypeError, ValueError) as e:
+        logger.warning("Failed to read spec cache: %s", e)
+        return None
+    if cached_stamp != stamp or not isinstance(spec, EnvSpec):
+        return None
+    return spec
+
+
+def store_cached_spec(spec_path: Path, spec: EnvSpec) -> None:
+    """Pickle ``spec`` for later runs, replacing any previous entry atomically."""
+    entry = _spec_cache_entry(spec_path)
+    if entry is None:
+        return
+    cache_file, stamp = entry
+    try:
+        cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                pickle.dump((stamp, spec), handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, cache_file)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError as e:
+        logger.warning("Failed to write spec cache: %s", e)
@@ -0,0 +1,596 @@
+from __future__ import annotations
+
+import functools
+import json
+import os
+import sys
+import warnings
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from enum import Enum
+from importlib import import_module
+from pathlib import Path
+from types import MappingProxyType, ModuleType
+from typing import TYPE_CHECKING, Any, BinaryIO, TextIO, cast
+
+import typer
+
+from ..config import Config, load_config
+from ..utils import OptionalPath, find_up, resolve_optional_path_option
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from ..spec import EnvSpec
+
+    console: Console
+
+
+def version_callback(value: bool) -> None:
+    if value:
+        from .. import __version__
+
+        typer.echo(f"envkeep version: {__version__}")
+        raise typer.Exit()
+
+
+try:  # pragma: no cover - Click 8.0 compatibility
+    from click._utils import UNSET as _CLICK_UNSET
+except ImportError:  # pragma: no cover - Click >=8.1 renamed internals
+    _CLICK_UNSET: Sentinel | None = None
+
+if _CLICK_UNSET is None:  # pragma: no cover - Typer >=0.12 on newer Click versions
+    warnings.filterwarnings(  # type: ignore[unreachable]
+        "ignore",
+        message="The 'is_flag' and 'flag_value' parameters are not supported by Typer",
+        category=DeprecationWarning,
+    )
+
+
+@functools.cache
+def _console() -> Console:
+    """Return the shared Rich console, importing Rich on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+DEFAULT_OUTPUT_FORMAT = "text"
+# Set to "1" to reuse parsed specs across runs from a pickle cache under ~/.cache/envkeep
+SPEC_CACHE_ENV = "ENVKEEP_SPEC_CACHE"
+DEFAULT_PROFILE = "all"
+
+
+def main(
+    version: bool = typer.Option(
+        None,
+        "--version",
+        callback=version_callback,
+        is_eager=True,
+        help="Show the version and exit.",
+    ),
+) -> None:
+    """Callback to configure the main application context."""
+    pass
+
+
+class OutputFormat(str, Enum):
+    TEXT = "text"
+    JSON = "json"
+
+
+_FORMAT_MAP: Mapping[str, OutputFormat] = MappingProxyType({fmt.value: fmt for fmt in OutputFormat})
+
+
+def _parse_output_format(value: OutputFormat | str) -> OutputFormat:
+    if isinstance(value, OutputFormat):
+        return value
+    fmt = _FORMAT_MAP.get(str(value).lower())
+    if fmt is None:
+        allowed = ", ".join(_FORMAT_MAP)
+        raise typer.BadParameter(
+            f"Invalid value for '--format': output format must be one of: {allowed}",
+        )
+    return fmt
+
+
+def _option_with_value(*args: Any, **kwargs: Any) -> typer.models.OptionInfo:
+    option = cast(typer.models.OptionInfo, typer.Option(*args, **kwargs))
+    if option.param_decls:
+        option.param_decls = tuple(decl for decl in option.param_decls if isinstance(decl, str))
+    else:
+        option.param_decls = ()
+    if _CLICK_UNSET is not None and hasattr(option, "flag_value"):
+        option.flag_value = _CLICK_UNSET  # Click <8.1 treats flag_value=None as a boolean flag
+    return option
+
+
+def _coerce_output_format(raw: str) -> OutputFormat:
+    try:
+        return _parse_output_format(raw)
+    except typer.BadParameter as exc:
+        typer.echo(str(exc))
+        raise typer.Exit(code=2) from exc
+
+
+SPEC_OPTION = _option_with_value(
+    None,
+    "--spec",
+    "-s",
+    help="Path to envkeep spec (searches parents if not specified).",
+)
+FORMAT_OPTION = _option_with_value(
+    DEFAULT_OUTPUT_FORMAT,
+    "--format",
+    "-f",
+    help="Output format: text or json.",
+)
+FORMAT_OPTION.case_sensitive = False
+PROFILE_OPTION = _option_with_value(
+    DEFAULT_PROFILE,
+    "--profile",
+    "-p",
+    help="Profile to validate (all to run every profile).",
+)
+PROFILE_OPTION.show_default = True
+PROFILE_BASE_OPTION = _option_with_value(
+    None,
+    "--profile-base",
+    help="Override the base directory used to resolve relative profile env_file paths.",
+)
+GENERATE_OUTPUT_OPTION = _option_with_value(
+    None,
+    "--output",
+    "-o",
+    help="Where to write the generated file.",
+)
+COMPACT_OPTION = typer.Option(
+    False,
+    "--compact",
+    help="Emit minified JSON without indentation (applies to --format json).",
+)
+ENV_FILE_ARGUMENT = typer.Argument(..., help="Path to the environment file.")
+DIFF_FIRST_ARGUMENT = typer.Argument(..., help="Baseline environment file.")
+DIFF_SECOND_ARGUMENT = typer.Argument(..., help="Target environment file.")
+
+SPEC_OPTION_DEFAULT = cast(OptionalPath, SPEC_OPTION)
+FORMAT_OPTION_DEFAULT = cast(str, FORMAT_OPTION)
+COMPACT_OPTION_DEFAULT = cast(bool, COMPACT_OPTION)
+PROFILE_OPTION_DEFAULT = cast(str, PROFILE_OPTION)
+PROFILE_BASE_OPTION_DEFAULT = cast(OptionalPath, PROFILE_BASE_OPTION)
+GENERATE_OUTPUT_OPTION_DEFAULT = cast(OptionalPath, GENERATE_OUTPUT_OPTION)
+
+
+@functools.cache
+def _orjson() -> ModuleType | None:
+    """Return ``orjson`` when the ``fast`` extra is installed, importing it on first use."""
+    try:
+        return import_module("orjson")
+    except ModuleNotFoundError:
+        return None
+
+
+def _emit_json(payload: Any, *, compact: bool = False) -> None:
+    """Encode ``payload`` straight onto stdout instead of building an intermediate str.
+
+    ``compact`` drops indentation and separator spaces for machine consumers. The
+    orjson path writes non-ASCII text as raw UTF-8, while the stdlib fallback keeps
+    ``\\uXXXX`` escapes; both parse to the same payload.
+    """
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    orjson = _orjson()
+    if orjson is not None and buffer is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        stream.flush()
+        buffer.write(orjson.dumps(payload, option=option))
+        buffer.flush()
+        return
+    if compact:
+        json.dump(payload, stream, separators=(",", ":"))
+    else:
+        json.dump(payload, stream, indent=2)
+    stream.write("\n")
+
+
+def _spec_base_dir(spec: Path) -> Path:
+    """Return the directory used as the reference point for spec-relative paths."""
+
+    return spec.parent.resolve() if str(spec) != "-" else Path.cwd()
+
+
+def _resolve_profile_path(raw: str, *, base_dir: Path) -> Path:
+    """Return an absolute profile path, honoring relative and user-expanded inputs."""
+
+    candidate = Path(raw).expanduser()
+    if raw == "-" or candidate.is_absolute():
+        return candidate
+    return (base_dir / candidate).resolve()
+
+
+@functools.lru_cache(maxsize=1)
+def _read_stream(stream: TextIO) -> str:
+    buffer: BinaryIO | None = getattr(stream, "buffer", None)
+    if buffer is None:
+        return stream.read()
+    # One bulk decode beats the text wrapper's chunked decoding on large pastes
+    text = buffer.read().decode(stream.encoding or "utf-8", stream.errors or "strict")
+    if "\r" in text:  # keep the text wrapper's universal-newline translation
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _read_stdin_once() -> str:
+    """Return stdin contents, reading the current ``sys.stdin`` stream at most once.
+
+    The cache is keyed on the stream object so a replaced ``sys.stdin`` (for
+    example a test runner feeding new input) is read afresh.
+    """
+
+    return _read_stream(sys.stdin)
+
+
+def _locate_spec(spec: Path | None, *, config: Config | None = None) -> Path:
+    """Return ``spec`` or fall back to the configured spec and an upward search."""
+    if spec is None:
+        spec = (config or load_config()).spec_path
+
+    if spec is None:
+        spec = find_up("envkeep.toml")
+        if spec is None:
+            raise typer.BadParameter("spec file not found (envkeep.toml)")
+    return spec
+
+
+def _read_spec_input(
+    spec: Path | None,
+    *,
+    config: Config | None = None,
+) -> tuple[Path, str | None]:
+    """Return the resolved spec path plus stdin contents when ``spec`` is ``-``."""
+    spec_path = _locate_spec(spec, config=config)
+    if str(spec_path) == "-":
+        return spec_path, _read_stdin_once()
+    return spec_path, None
+
+
+def _resolve_profile_base_dir(
+    profile_base: Path | None,
+    *,
+    default_base: Path,
+    config: Config | None = None,
+) -> Path:
+    """Validate and resolve the profile base directory for doctor/inspect commands."""
+    if profile_base is None:
+        profile_base = (config or load_config()).profile_base
+
+    if profile_base is None:
+        return default_base
+    candidate = profile_base.expanduser()
+    if not candidate.exists():
+        raise typer.BadParameter(f"profile base '{candidate}' does not exist")
+    if not candidate.is_dir():
+        raise typer.BadParameter(f"profile base '{candidate}' is not a directory")
+    return candidate.resolve()
+
+
+def _resolve_command_paths(
+    spec: Path | None,
+    profile_base: Path | None,
+) -> tuple[Path, str | None, Path]:
+    """Resolve the spec path, stdin spec data and profile base dir for inspect/doctor."""
+
+    # One pyproject.toml parse serves the spec lookup and the profile base fallback
+    config = load_config()
+    spec_path, stdin_spec = _read_spec_input(spec or config.spec_path, config=config)
+    profile_base_dir = _resolve_profile_base_dir(
+        resolve_optional_path_option(profile_base) or config.profile_base,
+        default_base=config.project_root or _spec_base_dir(spec_path),
+        config=config,
+    )
+    return spec_path, stdin_spec, profile_base_dir
+
+
+def _usage_error(message: str) -> None:
+    """Emit a usage error to stderr and exit with the conventional code."""
+
+    sys.stderr.write(f"{message}\n")
+    raise typer.Exit(code=2)
+
+
+def _load_spec_cached(path: Path) -> EnvSpec:
+    """Parse ``path`` through the opt-in pickle cache keyed on its mtime and size."""
+    from ..cache import load_cached_spec, store_cached_spec
+    from ..spec import EnvSpec
+
+    spec = load_cached_spec(path)
+    if spec is None:
+        spec = EnvSpec.from_file(path)
+        store_cached_spec(path, spec)
+    return spec
+
+
+def _load_spec_from_path(path: Path, stdin_data: str | None) -> EnvSpec:
+    """Load a spec from a path, handling stdin."""
+    from .._compat import tomllib
+    from ..spec import EnvSpec
+
+    path_str = str(path)
+    try:
+        if path_str == "-":
+            content = stdin_data if stdin_data is not None else _read_stdin_once()
+            if not content.strip():
+                raise typer.BadParameter("spec input from stdin is empty")
+            data = tomllib.loads(content)
+            return EnvSpec.from_dict(data)
+        if os.environ.get(SPEC_CACHE_ENV) == "1":
+            return _load_spec_cached(path)
+        return EnvSpec.from_file(path)
+    except FileNotFoundError as exc:
+        raise typer.BadParameter(f"spec file not found: {path}") from exc
+    except tomllib.TOMLDecodeError as exc:
+        detail = getattr(exc, "msg", str(exc))
+        line = getattr(exc, "lineno", None)
+        col = getattr(exc, "colno", None)
+        if line is not None and col is not None:
+            detail = f"{detail} (line {line}, column {col})"
+        message = f"failed to parse spec: {detail}"
+        typer.echo(message)
+        raise typer.BadParameter(message) from exc
+    except Exception as exc:
+        raise typer.BadParameter(f"failed to load spec: {exc}") from exc
+
+
+def _merge_specs(
+    base_spec: EnvSpec,
+    imported_spec: EnvSpec,
+    existing_var_names: set[str],
+    existing_profile_names: set[str],
+) -> None:
+    """Merge an imported spec into a base spec, updating the known-name sets in place."""
+    for var in imported_spec.variables:
+        if var.name not in existing_var_names:
+            existing_var_names.add(var.name)
+            base_spec.variables.append(var)
+    for prof in imported_spec.profiles:
+        if prof.name not in existing_profile_names:
+            existing_profile_names.add(prof.name)
+            base_spec.profiles.append(prof)
+
+
+def load_spec(path: Path | None, *, stdin_data: str | None = None) -> EnvSpec:
+    return load_spec_resolved(_locate_spec(path), stdin_data=stdin_data)
+
+
+def load_spec_resolved(path: Path, *, stdin_data: str | None = None) -> EnvSpec:
+    """Load the spec at an already-resolved ``path``, merging its imports."""
+    base_spec = _load_spec_from_path(path, stdin_data)
+    if not base_spec.imports:
+        return base_spec
+
+    base_dir = path.parent
+    existing_var_names = {var.name for var in base_spec.variables}
+    existing_profile_names = {prof.name for prof in base_spec.profiles}
+    for import_path_str in base_spec.imports:
+        import_path = base_dir / import_path_str
+        imported_spec = load_spec_resolved(import_path)
+        _merge_specs(base_spec, imported_spec, existing_var_names, existing_profile_names)
+    # Lookup caches were built before the merge; refresh them once for all imports
+    base_spec._rebuild_caches()
+
+    return base_spec
+
+
+def check(
+    env_file: Path = ENV_FILE_ARGUMENT,
+    spec: OptionalPath = SPEC_OPTION_DEFAULT,
+    output_format: str = FORMAT_OPTION_DEFAULT,
+    compact: bool = COMPACT_OPTION_DEFAULT,
+    allow_extra: bool = typer.Option(
+        False,
+        "--allow-extra",
+        help="Allow variables not declared in the spec.",
+    ),
+    fail_on_warnings: bool = typer.Option(
+        False,
+        "--fail-on-warnings",
+        help="Treat warnings as errors for CI enforcement.",
+    ),
+    summary_top: int = typer.Option(
+        3,
+        "--summary-top",
+        help="Limit top impacted variables/codes shown in summaries (0 to suppress).",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Disable caching of validation reports.",
+    ),
+) -> None:
+    """Validate an environment against the specification."""
+
+    from ._commands.check import run as run_check
+
+    run_check(
+        env_file=env_file,
+        spec=spec,
+        output_format=output_format,
+        compact=compact,
+        allow_extra=allow_extra,
+        fail_on_warnings=fail_on_warnings,
+        summary_top=summary_top,
+        no_cache=no_cache,
+    )
+
+
+def diff(
+    first: Path = DIFF_FIRST_ARGUMENT,
+    second: Path = DIFF_SECOND_ARGUMENT,
+    spec: OptionalPath = SPEC_OPTION_DEFAULT,
+    output_format: str = FORMAT_OPTION_DEFAULT,
+    compact: bool = COMPACT_OPTION_DEFAULT,
+    summary_top: int = typer.Option(
+        3,
+        "--summary-top",
+        help="Limit top impacted variables shown in summaries (0 to suppress).",
+    ),
+) -> None:
+    """Compare two environment files using the spec for normalization."""
+
+    from ._commands.diff import run as run_diff
+
+    run_diff(
+        first=first,
+        second=second,
+        spec=spec,
+        output_format=output_format,
+        compact=compact,
+        summary_top=summary_top,
+    )
+
+
+def generate(
+    spec: OptionalPath = SPEC_OPTION_DEFAULT,
+    output: OptionalPath = GENERATE_OUTPUT_OPTION_DEFAULT,
+    no_redact_secrets: bool = typer.Option(
+        False,
+        "--no-redact-secrets",
+        help="Disable masking for variables marked as secret.",
+    ),
+) -> None:
+    """Generate a sanitized .env example from the spec."""
+
+    from ._commands.generate import run as run_generate
+
+    run_generate(
+        spec=spec,
+        output=output,
+        no_redact_secrets=no_redact_secrets,
+    )
+
+
+def inspect(
+    spec: OptionalPath = SPEC_OPTION_DEFAULT,
+    output_format: str = FORMAT_OPTION_DEFAULT,
+    compact: bool = COMPACT_OPTION_DEFAULT,
+    profile_base: OptionalPath = PROFILE_BASE_OPTION_DEFAULT,
+) -> None:
+    """Print a summary of variables and profiles declared in the spec."""
+
+    from ._commands.inspect import run as run_inspect
+
+    run_inspect(
+        spec=spec,
+        output_format=output_format,
+        compact=compact,
+        profile_base=profile_base,
+    )
+
+
+def doctor(
+    spec: OptionalPath = SPEC_OPTION_DEFAULT,
+    profile: str = PROFILE_OPTION_DEFAULT,
+    output_format: str = FORMAT_OPTION_DEFAULT,
+    compact: bool = COMPACT_OPTION_DEFAULT,
+    profile_base: OptionalPath = PROFILE_BASE_OPTION_DEFAULT,
+    allow_extra: bool = typer.Option(
+        False,
+        "--allow-extra",
+        help="Allow extra variables when validating profiles.",
+    ),
+    fail_on_warnings: bool = typer.Option(
+        False,
+        "--fail-on-warnings",
+        help="Fail when any profile emits warnings.",
+    ),
+    summary_top: int = typer.Option(
+        3,
+        "--summary-top",
+        help="Limit top impacted variables/codes shown in summaries (0 to suppress).",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Disable caching of validation reports.",
+    ),
+) -> None:
+    """Validate one or more profiles declared in the spec."""
+
+    from ._commands.doctor import run as run_doctor
+
+    run_doctor(
+        spec=spec,
+        profile=profile,
+        output_format=output_format,
+        compact=compact,
+        profile_base=profile_base,
+        allow_extra=allow_extra,
+        fail_on_warnings=fail_on_warnings,
+        summary_top=summary_top,
+        no_cache=no_cache,
+    )
+
+
+_COMMANDS: dict[str, Callable[..., None]] = {
+    "check": check,
+    "diff": diff,
+    "generate": generate,
+    "inspect": inspect,
+    "doctor": doctor,
+}
+
+
+def _build_app(commands: Iterable[str] = _COMMANDS) -> typer.Typer:
+    """Return a Typer app exposing only ``commands``.
+
+    Click builds a command object, including every parameter, for each
+    registered command on invocation, so registering fewer keeps startup lean.
+    """
+
+    target = typer.Typer(
+        help="Deterministic environment spec and drift detection for .env workflows.",
+        add_completion=True,
+    )
+    target.callback()(main)
+    for name in commands:
+        target.command(name)(_COMMANDS[name])
+    return target
+
+
+def _sniff_subcommand(argv: Sequence[str]) -> tuple[str, ...]:
+    """Guess which commands an invocation needs from its leading argument."""
+
+    if not argv or any(name.startswith("_ENVKEEP_COMPLETE") for name in os.environ):
+        return tuple(_COMMANDS)
+    first = argv[0]
+    if first == "--version":
+        return ()
+    if first in _COMMANDS:
+        return (first,)
+    return tuple(_COMMANDS)
+
+
+def run(argv: Sequence[str] | None = None) -> None:
+    """Console script entry point that registers only the requested command."""
+
+    args = list(sys.argv[1:] if argv is None else argv)
+    _build_app(_sniff_subcommand(args))(args=args, prog_name="envkeep")
+
+
+app = _build_app()
+
+
+def __getattr__(name: str) -> Any:
+    if name == "console":
+        return _console()
+    # Renderers live beside the command modules so plain imports stay light
+    if name in {"render_validation_report", "render_diff_report", "STREAM_ROW_THRESHOLD"}:
+        from . import _render
+
+        return getattr(_render, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if __name__ == "__main__":
+    run()
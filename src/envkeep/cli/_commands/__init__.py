@@ -0,0 +1 @@
+"""Command implementations, imported on first use by the ``envkeep.cli`` stubs."""
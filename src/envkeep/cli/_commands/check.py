@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+import typer
+
+from ...cache import Cache
+from ...plugins import load_backends
+from ...snapshot import EnvSnapshot
+from ...spec import EnvSpec
+from ...utils import OptionalPath
+from .. import (
+    _coerce_output_format,
+    _read_spec_input,
+    _read_stdin_once,
+    _usage_error,
+    load_spec_resolved,
+)
+from .._render import _handle_validation_output
+
+logger = logging.getLogger(__name__)
+
+
+def _fetch_remote_values(spec: EnvSpec) -> dict[str, str]:
+    """Fetch values from all remote backends defined in the spec."""
+    sources_by_backend: dict[str, dict[str, str]] = {}
+    for var in spec.variables:
+        if var.source:
+            try:
+                backend_name, source_uri = var.source.split(":", 1)
+                sources_by_backend.setdefault(backend_name, {})[var.name] = source_uri
+            except ValueError:
+                # Ignore malformed source strings
+                pass
+    if not sources_by_backend:
+        # Loading plugins imports their SDKs, so skip discovery when nothing is remote
+        return {}
+
+    backends = load_backends()
+    fetched_values: dict[str, str] = {}
+    for backend_name, sources in sources_by_backend.items():
+        backend = backends.get(backend_name)
+        if backend is None:
+            continue
+        try:
+            results = backend.fetch(sources)
+            fetched_values.update(results)
+        except Exception:
+            logger.exception("Plugin %s failed to fetch secrets", backend_name)
+
+    return fetched_values
+
+
+def run(
+    *,
+    env_file: Path,
+    spec: OptionalPath,
+    output_format: str,
+    compact: bool,
+    allow_extra: bool,
+    fail_on_warnings: bool,
+    summary_top: int,
+    no_cache: bool,
+) -> None:
+    if summary_top < 0:
+        _usage_error("summary limit must be non-negative")
+    env_path = str(env_file)
+    spec_path, stdin_spec = _read_spec_input(spec)
+    if str(spec_path) == "-" and env_path == "-":
+        _usage_error("cannot read both spec and environment from stdin")
+    env_spec = load_spec_resolved(spec_path, stdin_data=stdin_spec)
+
+    cache = Cache() if not no_cache else None
+
+    report = cache.get_report(env_file, spec_path) if cache else None
+    if report is None:
+        # Fetch remote values from plugins
+        remote_values = _fetch_remote_values(env_spec)
+
+        if env_path == "-":
+            snapshot = EnvSnapshot.from_text(_read_stdin_once(), source="stdin")
+        else:
+            snapshot = EnvSnapshot.from_env_file(env_file)
+
+        # Merge local and remote values, with remote taking precedence
+        combined_values = snapshot.to_dict()
+        combined_values.update(remote_values)
+
+        # Create a new snapshot from the combined values for validation
+        combined_snapshot = EnvSnapshot.from_dict(combined_values, source=str(env_file))
+
+        report = env_spec.validate(combined_snapshot, allow_extra=allow_extra)
+        if cache:
+            cache.set_report(env_file, spec_path, report)
+
+    fmt = _coerce_output_format(output_format)
+    exit_code = _handle_validation_output(
+        report,
+        source=str(env_file),
+        output_format=fmt,
+        fail_on_warnings=fail_on_warnings,
+        summary_top=summary_top,
+        compact=compact,
+    )
+    raise typer.Exit(code=exit_code)
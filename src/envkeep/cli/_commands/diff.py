@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import typer
+
+from ...snapshot import EnvSnapshot
+from ...utils import OptionalPath
+from .. import (
+    _coerce_output_format,
+    _read_spec_input,
+    _read_stdin_once,
+    _usage_error,
+    load_spec_resolved,
+)
+from .._render import _handle_diff_output
+
+
+def run(
+    *,
+    first: Path,
+    second: Path,
+    spec: OptionalPath,
+    output_format: str,
+    compact: bool,
+    summary_top: int,
+) -> None:
+    if summary_top < 0:
+        _usage_error("summary limit must be non-negative")
+    spec_path, stdin_spec = _read_spec_input(spec)
+    minus_count = (str(first) == "-") + (str(second) == "-")
+    if str(spec_path) == "-" and minus_count:
+        _usage_error("cannot combine spec from stdin with environment stdin input")
+    env_spec = load_spec_resolved(spec_path, stdin_data=stdin_spec)
+    if minus_count > 1:
+        _usage_error("stdin can only be supplied for one file in diff.")
+
+    def load_snapshot(path: Path, *, label: str) -> EnvSnapshot:
+        if str(path) == "-":
+            return EnvSnapshot.from_text(_read_stdin_once(), source=f"stdin:{label}")
+        return EnvSnapshot.from_env_file(path)
+
+    left = load_snapshot(first, label="left")
+    right = load_snapshot(second, label="right")
+    report = env_spec.diff(left, right)
+    fmt = _coerce_output_format(output_format)
+    exit_code = _handle_diff_output(
+        report,
+        left=str(first),
+        right=str(second),
+        output_format=fmt,
+        summary_top=summary_top,
+        compact=compact,
+    )
+    raise typer.Exit(code=exit_code)
@@ -0,0 +1,452 @@
+from __future__ import annotations
+
+import json
+import sys
+import threading
+from collections import Counter, deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack, nullcontext
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar, cast
+
+import typer
+
+from ...cache import Cache
+from ...report import IssueSeverity, ValidationReport
+from ...snapshot import EnvSnapshot
+from ...utils import (
+    OptionalPath,
+    casefold_sorted,
+    line_number_sort_key,
+    normalized_limit,
+    sorted_counter,
+)
+from .. import (
+    _FORMAT_MAP,
+    _coerce_output_format,
+    _console,
+    _orjson,
+    _resolve_command_paths,
+    _resolve_profile_path,
+    _usage_error,
+    load_spec_resolved,
+)
+from .._render import render_validation_report
+
+if TYPE_CHECKING:
+    from ...spec import ProfileSpec
+
+# Profiles are mostly file I/O, so a few threads overlap reads without oversubscribing
+_MAX_WORKERS = 8
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def _json_default(obj: Any) -> Any:
+    """Encoder hook for the few non-JSON values doctor payloads may carry."""
+    if isinstance(obj, Path):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _bounded_map(
+    pool: ThreadPoolExecutor,
+    fn: Callable[[_T], _R],
+    items: Iterable[_T],
+    *,
+    window: int,
+) -> Iterator[_R]:
+    """Like ``pool.map`` but with at most ``window`` results held at once, in order.
+
+    ``Executor.map`` submits everything up front, so finished reports pile up while
+    the caller is still rendering earlier profiles.
+    """
+
+    pending: deque[Future[_R]] = deque()
+    for item in items:
+        pending.append(pool.submit(fn, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+class _ProfileOutcome(NamedTuple):
+    """Result of resolving and validating one profile; ``report`` is None when missing."""
+
+    name: str
+    env_file: str
+    path: Path
+    path_str: str
+    report: ValidationReport | None
+
+
+class _DoctorJsonStream:
+    """Write the doctor JSON payload incrementally, one profile record at a time.
+
+    The layout matches ``json.dumps(payload, indent=2)`` of the buffered payload
+    with ``profiles`` as its first key, or ``separators=(",", ":")`` when compact.
+    With orjson installed, non-ASCII text is written as raw UTF-8 instead of
+    ``\\uXXXX`` escapes, so the bytes differ while the parsed payload is the same.
+    Nothing is written until the first record arrives, so a profile that raises
+    before then leaves stdout empty rather than holding a truncated document.
+    """
+
+    def __init__(self, *, compact: bool = False) -> None:
+        self._stream = sys.stdout
+        self._buffer = getattr(self._stream, "buffer", None)
+        self._compact = compact
+        self._orjson = _orjson()
+        self._profiles = 0
+        self._started = False
+
+    def _start(self) -> None:
+        self._started = True
+        self._stream.flush()
+        self._write(b'{"profiles":[' if self._compact else b'{\n  "profiles": [')
+
+    def _encode(self, value: Any, indent: bytes) -> bytes:
+        orjson = self._orjson
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS
+            if not self._compact:
+                option |= orjson.OPT_INDENT_2
+            data: bytes = orjson.dumps(value, default=_json_default, option=option)
+        elif self._compact:
+            data = json.dumps(value, separators=(",", ":"), default=_json_default).encode("utf-8")
+        else:
+            data = json.dumps(value, indent=2, default=_json_default).encode("utf-8")
+        return data.replace(b"\n", b"\n" + indent) if indent else data
+
+    def _write(self, data: bytes) -> None:
+        if self._buffer is None:
+            self._stream.write(data.decode("utf-8"))
+        else:
+            self._buffer.write(data)
+
+    def add_profile(self, record: dict[str, Any]) -> None:
+        if not self._started:
+            self._start()
+        if self._compact:
+            separator = b"," if self._profiles else b""
+            self._write(separator + self._encode(record, b""))
+        else:
+            separator = b",\n    " if self._profiles else b"\n    "
+            self._write(separator + self._encode(record, b"    "))
+        self._profiles += 1
+
+    def close(self, fields: dict[str, Any]) -> None:
+        if not self._started:
+            self._start()
+        if self._compact:
+            self._write(b"]")
+            for key, value in fields.items():
+                self._write(b"," + self._encode(key, b"") + b":" + self._encode(value, b""))
+            self._write(b"}\n")
+        else:
+            self._write(b"\n  ]" if self._profiles else b"]")
+            for key, value in fields.items():
+                self._write(
+                    b",\n  " + self._encode(key, b"") + b": " + self._encode(value, b"  "),
+                )
+            self._write(b"\n}\n")
+        if self._buffer is None:
+            self._stream.flush()
+        else:
+            self._buffer.flush()
+
+
+@dataclass(slots=True)
+class _DoctorAggregate:
+    """Running doctor totals, folded in as each profile is validated."""
+
+    top_limit: int
+    reports: int = 0
+    missing: int = 0
+    all_success: bool = True
+    severity_totals: dict[str, int] = field(
+        default_factory=lambda: {
+            IssueSeverity.ERROR.value: 0,
+            IssueSeverity.WARNING.value: 0,
+            IssueSeverity.INFO.value: 0,
+        },
+    )
+    warning_counts: dict[str, int] = field(
+        default_factory=lambda: {"duplicates": 0, "extra_variables": 0, "invalid_lines": 0},
+    )
+    duplicates: set[str] = field(default_factory=set)
+    extras: set[str] = field(default_factory=set)
+    invalid_lines: list[dict[str, Any]] = field(default_factory=list)
+    codes: Counter[str] = field(default_factory=Counter)
+    variable_counts: Counter[str] = field(default_factory=Counter)
+
+    def add_missing(self) -> None:
+        self.missing += 1
+
+    def add_report(self, profile: str, report: ValidationReport) -> dict[str, Any]:
+        """Fold ``report`` into the totals and return its warning summary."""
+
+        self.reports += 1
+        self.all_success = self.all_success and report.is_success
+        for key, value in report.severity_totals().items():
+            self.severity_totals[key] += value
+        warnings = report.warning_summary()
+        self.warning_counts["duplicates"] += len(warnings["duplicates"])
+        self.warning_counts["extra_variables"] += len(warnings["extra_variables"])
+        self.warning_counts["invalid_lines"] += len(warnings["invalid_lines"])
+        self.duplicates.update(warnings["duplicates"])
+        self.extras.update(warnings["extra_variables"])
+        # The per-profile dicts also go out in the JSON record, so tag copies, not originals
+        self.invalid_lines.extend(
+            dict(warning, profile=profile) for warning in warnings["invalid_lines"]
+        )
+        # Fold the report's own cached counters instead of re-walking every issue
+        if self.top_limit != 0:
+            self.codes.update(report.counts_by_code())
+        self.variable_counts.update(report.counts_by_variable())
+        return warnings
+
+    def most_common_codes(self) -> list[tuple[str, int]]:
+        if self.top_limit == 0:
+            return []
+        return sorted_counter(self.codes)[: self.top_limit]
+
+    def top_variables(self) -> list[tuple[str, int]]:
+        if self.top_limit == 0:
+            return []
+        return sorted_counter(self.variable_counts)[: self.top_limit]
+
+    def summary_payload(self, *, profile_base_dir: str) -> dict[str, Any]:
+        non_empty_severities = [key for key, value in self.severity_totals.items() if value > 0]
+        if not non_empty_severities:
+            non_empty_severities = list(self.severity_totals.keys())
+        return {
+            "profiles_with_reports": self.reports,
+            "missing_profiles": self.missing,
+            "severity_totals": self.severity_totals,
+            "is_success": self.reports > 0 and self.all_success and not self.missing,
+            "non_empty_severities": non_empty_severities,
+            "most_common_codes": self.most_common_codes(),
+            "variables": casefold_sorted(self.variable_counts),
+            "top_variables": self.top_variables(),
+            "profile_base_dir": profile_base_dir,
+        }
+
+    def warnings_payload(self) -> dict[str, Any]:
+        return {
+            "duplicates": casefold_sorted(self.duplicates),
+            "extra_variables": casefold_sorted(self.extras),
+            "invalid_lines": sorted(
+                self.invalid_lines,
+                key=lambda item: (
+                    item.get("profile", ""),
+                    *line_number_sort_key(item.get("line", "")),
+                ),
+            ),
+        }
+
+
+def _render_doctor_text_summary(
+    checked_profiles: int,
+    selected_profiles: int,
+    aggregate: _DoctorAggregate,
+    resolved_profile_records: list[tuple[str, str, Path, bool]],
+) -> None:
+    """Render the text summary for the doctor command."""
+    totals = aggregate.severity_totals
+    console = _console()
+    console.rule("Doctor Summary")
+    console.print(f"Profiles checked: {checked_profiles}/{selected_profiles}")
+    console.print(
+        " · ".join(
+            [
+                f"Missing profiles: {aggregate.missing}",
+                f"Total errors: {totals[IssueSeverity.ERROR.value]}",
+                f"Total warnings: {totals[IssueSeverity.WARNING.value]}",
+                f"Total info: {totals[IssueSeverity.INFO.value]}",
+            ],
+        ),
+    )
+    console.print(
+        "Warnings breakdown: "
+        f"Duplicates: {aggregate.warning_counts['duplicates']} · "
+        f"Extra variables: {aggregate.warning_counts['extra_variables']} · "
+        f"Invalid lines: {aggregate.warning_counts['invalid_lines']}",
+    )
+    if aggregate.variable_counts and aggregate.top_limit:
+        sorted_variables = casefold_sorted(aggregate.variable_counts)
+        console.print("Impacted variables: " + ", ".join(sorted_variables[: aggregate.top_limit]))
+    else:
+        # --summary-top 0 shows no names, so skip sorting the whole set
+        console.print("Impacted variables: ")
+    most_common_codes = aggregate.most_common_codes()
+    if most_common_codes:
+        formatted_codes = ", ".join(f"{code}({count})" for code, count in most_common_codes)
+        console.print(f"Top issue codes: {formatted_codes}")
+    top_variables = aggregate.top_variables()
+    if top_variables:
+        formatted_variables = ", ".join(f"{variable}({count})" for variable, count in top_variables)
+        console.print(f"Top impacted variables: {formatted_variables}")
+    else:
+        console.print("Top impacted variables: ")
+    if resolved_profile_records:
+        console.print("Resolved profile paths:")
+        for name, env_file_raw, resolved_path, exists in resolved_profile_records:
+            status = "" if exists else " (missing)"
+            console.print(f"  • {name}: {env_file_raw} -> {resolved_path}{status}")
+
+
+def run(
+    *,
+    spec: OptionalPath,
+    profile: str,
+    output_format: str,
+    compact: bool,
+    profile_base: OptionalPath,
+    allow_extra: bool,
+    fail_on_warnings: bool,
+    summary_top: int,
+    no_cache: bool,
+) -> None:
+    if summary_top < 0:
+        _usage_error("summary limit must be non-negative")
+
+    spec_path, stdin_spec, profile_base_dir = _resolve_command_paths(spec, profile_base)
+    env_spec = load_spec_resolved(spec_path, stdin_data=stdin_spec)
+    if not env_spec.profiles:
+        typer.echo("No profiles declared in spec.")
+        raise typer.Exit(code=0)
+    else:
+        cache = Cache() if not no_cache else None
+
+        selected_profiles: Sequence[ProfileSpec]
+        if profile == "all":
+            selected_profiles = env_spec.profiles
+        else:
+            # Cached view on the spec; .get doubles as the membership test
+            match = env_spec.profiles_by_name().get(profile)
+            if match is None:
+                raise typer.BadParameter(f"profile '{profile}' not found")
+            selected_profiles = (match,)
+
+        exit_code = 0
+        normalized_format = output_format.lower()
+        if normalized_format not in _FORMAT_MAP:
+            _coerce_output_format(output_format)  # reports the bad value and exits
+        use_json = normalized_format == "json"
+        checked_profiles = 0
+        top_limit = normalized_limit(summary_top) or 0
+        aggregate = _DoctorAggregate(top_limit=top_limit)
+        json_stream = _DoctorJsonStream(compact=compact) if use_json else None
+        # Only the text summary lists resolved paths; size the slots once up front
+        record_slots: list[tuple[str, str, Path, bool] | None] = (
+            [] if use_json else [None] * len(selected_profiles)
+        )
+        cache_lock = threading.Lock()
+        # Profiles often share an env file; resolve() walks the filesystem, so do it once
+        # each, up front, leaving the workers a read-only mapping
+        resolved_paths = {
+            env_file: _resolve_profile_path(env_file, base_dir=profile_base_dir)
+            for env_file in {item.env_file for item in selected_profiles}
+        }
+
+        def process(item: ProfileSpec) -> _ProfileOutcome:
+            env_path = resolved_paths[item.env_file]
+            env_path_str = str(env_path)
+            # Cache lookups tolerate a missing file, so the read itself is the existence check
+            report = cache.get_report(env_path, spec_path) if cache else None
+            if report is None:
+                try:
+                    snapshot = EnvSnapshot.from_env_file(env_path)
+                except (FileNotFoundError, NotADirectoryError):
+                    return _ProfileOutcome(item.name, item.env_file, env_path, env_path_str, None)
+                report = env_spec.validate(snapshot, allow_extra=allow_extra)
+                if cache:
+                    with cache_lock:
+                        cache.set_report(env_path, spec_path, report)
+            return _ProfileOutcome(item.name, item.env_file, env_path, env_path_str, report)
+
+        # Missing-profile notices skip Click's per-call echo handling; flushed once below
+        write_line = sys.stdout.write
+        with ExitStack() as stack:
+            outcomes: Iterator[_ProfileOutcome]
+            if len(selected_profiles) > 1:
+                pool = stack.enter_context(
+                    ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(selected_profiles))),
+                )
+                # Results come back in spec order, so output and exit codes stay deterministic
+                outcomes = _bounded_map(pool, process, selected_profiles, window=2 * _MAX_WORKERS)
+            else:
+                # A single profile has nothing to overlap; skip the pool's thread start-up
+                outcomes = map(process, selected_profiles)
+            for index, outcome in enumerate(outcomes):
+                name, env_file_raw, env_path, env_path_str, report = outcome
+                if record_slots:
+                    record_slots[index] = (name, env_file_raw, env_path, report is not None)
+                if report is None:
+                    aggregate.add_missing()
+                    if json_stream is not None:
+                        json_stream.add_profile(
+                            {
+                                "profile": name,
+                                "env_file": env_file_raw,
+                                "resolved_env_file": env_path_str,
+                                "path": env_path_str,
+                                "error": "missing env file",
+                            },
+                        )
+                    else:
+                        write_line(f"Profile {name}: missing env file {env_path}\n")
+                    exit_code = 1
+                    continue
+
+                checked_profiles += 1
+                warnings = aggregate.add_report(name, report)
+                if json_stream is not None:
+                    # One aggregation pass feeds both the report and summary sections
+                    encoded = report.to_dict(top_limit=top_limit, include_summary=True)
+                    json_stream.add_profile(
+                        {
+                            "profile": name,
+                            "env_file": env_file_raw,
+                            "resolved_env_file": env_path_str,
+                            "path": env_path_str,
+                            "report": encoded["report"],
+                            "summary": encoded["summary"],
+                            "warnings": warnings,
+                        },
+                    )
+                else:
+                    console = _console()
+                    # Rich's buffer turns a profile's flushes into one write; the plain
+                    # TSV path writes to the file directly, so only buffer on terminals
+                    with console if console.is_terminal else nullcontext():
+                        console.rule(f"Profile: {name}")
+                        render_validation_report(report, source=env_path_str, top_limit=top_limit)
+                if report.has_errors or (fail_on_warnings and report.has_warnings):
+                    exit_code = 1
+
+        if json_stream is not None:
+            json_stream.close(
+                {
+                    "allow_extra": allow_extra,
+                    "fail_on_warnings": fail_on_warnings,
+                    "summary": aggregate.summary_payload(profile_base_dir=str(profile_base_dir)),
+                    "warnings": aggregate.warnings_payload(),
+                },
+            )
+        else:
+            sys.stdout.flush()
+            _render_doctor_text_summary(
+                checked_profiles,
+                len(selected_profiles),
+                aggregate,
+                cast(list[tuple[str, str, Path, bool]], record_slots),
+            )
+        raise typer.Exit(code=exit_code)
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import typer
+
+from ...utils import OptionalPath
+from .. import _read_spec_input, load_spec_resolved
+
+
+def run(*, spec: OptionalPath, output: OptionalPath, no_redact_secrets: bool) -> None:
+    spec_path, stdin_spec = _read_spec_input(spec)
+    env_spec = load_spec_resolved(spec_path, stdin_data=stdin_spec)
+    content = env_spec.generate_example(redact_secrets=not no_redact_secrets)
+    if output:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(content, encoding="utf-8")
+        typer.echo(f"Wrote example to {output}")
+    else:
+        typer.echo(content)
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from ...utils import OptionalPath
+from .. import (
+    OutputFormat,
+    _coerce_output_format,
+    _console,
+    _emit_json,
+    _resolve_command_paths,
+    _resolve_profile_path,
+    load_spec_resolved,
+)
+
+
+def run(
+    *,
+    spec: OptionalPath,
+    output_format: str,
+    compact: bool,
+    profile_base: OptionalPath,
+) -> None:
+    spec_path, stdin_spec, profile_base_dir = _resolve_command_paths(spec, profile_base)
+    env_spec = load_spec_resolved(spec_path, stdin_data=stdin_spec)
+    fmt = _coerce_output_format(output_format)
+    if fmt is OutputFormat.JSON:
+        variables_payload = [
+            {
+                "name": variable.name,
+                "type": variable.var_type.value,
+                "required": variable.required,
+                "secret": variable.secret,
+                "description": variable.description,
+                "default": variable.default,
+                "choices": list(variable.choices),
+                "pattern": variable.pattern.pattern if variable.pattern else None,
+                "example": variable.example,
+                "allow_empty": variable.allow_empty,
+            }
+            for variable in env_spec.variables
+        ]
+        profiles_payload = []
+        for profile in env_spec.profiles:
+            resolved_path = _resolve_profile_path(
+                profile.env_file,
+                base_dir=profile_base_dir,
+            )
+            profiles_payload.append(
+                {
+                    "name": profile.name,
+                    "env_file": profile.env_file,
+                    "resolved_env_file": str(resolved_path),
+                    "description": profile.description,
+                },
+            )
+        payload = {
+            "summary": env_spec.summary(),
+            "variables": variables_payload,
+            "profiles": profiles_payload,
+            "profile_base_dir": str(profile_base_dir),
+        }
+        _emit_json(payload, compact=compact)
+        return
+    from rich.table import Table
+
+    table = Table(title=f"Envkeep Summary (version {env_spec.version})")
+    table.add_column("Variable")
+    table.add_column("Type")
+    table.add_column("Required")
+    table.add_column("Secret")
+    table.add_column("Description")
+    for variable in env_spec.variables:
+        table.add_row(
+            variable.name,
+            variable.var_type.value,
+            "yes" if variable.required else "no",
+            "yes" if variable.secret else "no",
+            variable.description or "",
+        )
+    if env_spec.profiles:
+        table.add_section()
+        table.add_row("Profiles", "", "", "", "")
+        for profile in env_spec.profiles:
+            resolved_path = _resolve_profile_path(
+                profile.env_file,
+                base_dir=profile_base_dir,
+            )
+            descriptor = profile.description or profile.env_file
+            if descriptor:
+                descriptor = f"{descriptor} ({resolved_path})"
+            else:
+                descriptor = str(resolved_path)
+            table.add_row(
+                f"• {profile.name}",
+                "",
+                "",
+                "",
+                descriptor,
+            )
+    _console().print(table)
@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence, Sized
+from enum import Enum
+from itertools import islice
+from operator import attrgetter
+
+from ..report import DiffKind, DiffReport, IssueSeverity, ValidationReport
+from ..utils import normalized_limit
+from . import OutputFormat, _console, _emit_json
+
+# Sections larger than this are streamed row by row instead of laid out as a table
+STREAM_ROW_THRESHOLD = 500
+# Streamed rows go to Rich in batches; one render per row dominated large reports
+_STREAM_BATCH_ROWS = 256
+# Fetches a row's cells in one C-level call; diff rows keep the redacting accessors
+_ISSUE_CELLS = attrgetter("variable", "code", "message", "hint")
+
+
+# Cell text could otherwise split a TSV row; backslash is escaped too so the mapping reverses
+_PLAIN_CELL_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _write_plain_rows(rows: Iterable[tuple[str, ...]]) -> None:
+    """Write tab-separated rows straight to the console's file, bypassing Rich layout."""
+    _console().file.writelines(
+        "\t".join([cell.translate(_PLAIN_CELL_ESCAPES) for cell in row]) + "\n" for row in rows
+    )
+
+
+def _print_markup_rows(rows: Iterable[str]) -> None:
+    """Print markup rows a batch at a time so output still starts before the last row."""
+    console = _console()
+    rows = iter(rows)
+    while batch := list(islice(rows, _STREAM_BATCH_ROWS)):
+        # Table cells are never auto-highlighted; skip the regex pass so both layouts match
+        console.print("\n".join(batch), soft_wrap=True, highlight=False)
+
+
+def _handle_validation_output(
+    report: ValidationReport,
+    *,
+    source: str,
+    output_format: OutputFormat,
+    fail_on_warnings: bool,
+    summary_top: int | None,
+    compact: bool = False,
+) -> int:
+    limit = normalized_limit(summary_top)
+    if output_format is OutputFormat.JSON:
+        _emit_json(report.to_dict(top_limit=limit, include_summary=True), compact=compact)
+    else:
+        render_validation_report(report, source=source, top_limit=limit)
+    exit_code = 0
+    if report.has_errors or (fail_on_warnings and report.has_warnings):
+        exit_code = 1
+    return exit_code
+
+
+def _handle_diff_output(
+    report: DiffReport,
+    *,
+    left: str,
+    right: str,
+    output_format: OutputFormat,
+    summary_top: int | None,
+    compact: bool = False,
+) -> int:
+    limit = normalized_limit(summary_top)
+    if output_format is OutputFormat.JSON:
+        _emit_json(report.to_dict(top_limit=limit, include_summary=True), compact=compact)
+    else:
+        render_diff_report(report, left=left, right=right, top_limit=limit)
+    return 0 if report.is_clean() else 1
+
+
+_SEVERITY_LABELS = (
+    ("Errors", IssueSeverity.ERROR.value),
+    ("Warnings", IssueSeverity.WARNING.value),
+    ("Info", IssueSeverity.INFO.value),
+)
+
+
+_DIFF_KIND_LABELS = (
+    ("Missing", DiffKind.MISSING.value),
+    ("Extra", DiffKind.EXTRA.value),
+    ("Changed", DiffKind.CHANGED.value),
+)
+
+# Section headings and styled badges never change, so build the markup once at import
+_SEVERITY_STYLES = {
+    IssueSeverity.ERROR: "red",
+    IssueSeverity.WARNING: "yellow",
+    IssueSeverity.INFO: "blue",
+}
+_SEVERITY_HEADINGS = {
+    IssueSeverity(key): f"[bold underline]{label}[/]" for label, key in _SEVERITY_LABELS
+}
+_SEVERITY_BADGES = {
+    severity: f"[{style}]{severity.value.upper()}[/{style}]"
+    for severity, style in _SEVERITY_STYLES.items()
+}
+
+_DIFF_KIND_STYLES = {
+    DiffKind.MISSING: "yellow",
+    DiffKind.EXTRA: "blue",
+    DiffKind.CHANGED: "red",
+}
+_DIFF_KIND_HEADINGS = {
+    DiffKind(key): f"[bold underline]{label}[/]" for label, key in _DIFF_KIND_LABELS
+}
+_DIFF_KIND_BADGES = {
+    kind: f"[{style}]{kind.value.upper()}[/{style}]" for kind, style in _DIFF_KIND_STYLES.items()
+}
+
+
+def _format_counts_summary(
+    report: ValidationReport | DiffReport,
+    *,
+    sections: Sequence[tuple[Enum, Sized]],
+    labels: tuple[tuple[str, str], ...],
+    top_limit: int | None,
+) -> str:
+    """Summarize non-empty section counts (or all zeros) plus the most impacted variables."""
+    limit = normalized_limit(top_limit)
+    totals = {key.value: len(items) for key, items in sections}
+    parts = [f"{label}: {totals[key]}" for label, key in labels if totals.get(key)] or [
+        f"{label}: 0" for label, _ in labels
+    ]
+    if limit != 0:
+        top_variables = [name for name, _ in report.top_variables(limit)]
+        if top_variables:
+            parts.append("Impacted: " + ", ".join(top_variables))
+    return " · ".join(parts)
+
+
+def render_validation_report(
+    report: ValidationReport,
+    *,
+    source: str,
+    top_limit: int | None = None,
+) -> None:
+    from rich.markup import escape
+    from rich.table import Table
+    from rich.text import Text
+
+    console = _console()
+    console.print(f"Validating [bold]{source}[/bold]")
+    if not report.issues:
+        console.print("[green]All checks passed.[/green]")
+        return
+    sections = report.issue_sections()
+    # Pipes and CI logs get plain TSV rows; table measurement only pays off on a terminal
+    plain = not console.is_terminal
+    first_section = True
+    for severity, issues in sections:
+        if not first_section:
+            console.print()
+        first_section = False
+        console.print(_SEVERITY_HEADINGS[severity])
+        if plain:
+            label = severity.value.upper()
+            _write_plain_rows(
+                (label, variable, code, message, hint or "")
+                for variable, code, message, hint in map(_ISSUE_CELLS, issues)
+            )
+            continue
+        badge = _SEVERITY_BADGES[severity]
+        if len(issues) > STREAM_ROW_THRESHOLD:
+            # Large sections skip table layout so output starts with the first batch
+            _print_markup_rows(
+                "\t".join(
+                    (badge, escape(variable), escape(code), escape(message), escape(hint or "")),
+                )
+                for variable, code, message, hint in map(_ISSUE_CELLS, issues)
+            )
+            continue
+        # One pre-styled Text per section spares Rich a markup parse for every row's badge
+        badge_text = Text.assemble((severity.value.upper(), _SEVERITY_STYLES[severity]))
+        table = Table(show_header=True, header_style="bold")
+        table.add_column("Severity")
+        table.add_column("Variable")
+        table.add_column("Code")
+        table.add_column("Message")
+        table.add_column("Hint", overflow="fold")
+        for issue in issues:
+            variable, code, message, hint = _ISSUE_CELLS(issue)
+            table.add_row(badge_text, variable, code, message, hint or "")
+        console.print(table)
+    console.print(
+        _format_counts_summary(
+            report,
+            sections=sections,
+            labels=_SEVERITY_LABELS,
+            top_limit=top_limit,
+        ),
+    )
+
+
+def render_diff_report(
+    report: DiffReport,
+    *,
+    left: str,
+    right: str,
+    top_limit: int | None = None,
+) -> None:
+    from rich.markup import escape
+    from rich.table import Table
+    from rich.text import Text
+
+    console = _console()
+    console.print(f"Diffing [bold]{left}[/bold] -> [bold]{right}[/bold]")
+    if report.is_clean():
+        console.print("[green]No drift detected.[/green]")
+        return
+    sections = report.entry_sections()
+    plain = not console.is_terminal
+    first_section = True
+    for kind, entries in sections:
+        if not first_section:
+            console.print()
+        first_section = False
+        console.print(_DIFF_KIND_HEADINGS[kind])
+        if plain:
+            label = kind.value.upper()
+            _write_plain_rows(
+                (
+                    entry.variable,
+                    label,
+                    entry.redacted_left() or "",
+                    entry.redacted_right() or "",
+                )
+                for entry in entries
+            )
+            continue
+        badge = _DIFF_KIND_BADGES[kind]
+        if len(entries) > STREAM_ROW_THRESHOLD:
+            # Large sections skip table layout so output starts with the first batch
+            _print_markup_rows(
+                "\t".join(
+                    (
+                        escape(entry.variable),
+                        badge,
+                        escape(entry.redacted_left() or ""),
+                        escape(entry.redacted_right() or ""),
+                    ),
+                )
+                for entry in entries
+            )
+            continue
+        badge_text = Text.assemble((kind.value.upper(), _DIFF_KIND_STYLES[kind]))
+        table = Table(show_header=True, header_style="bold")
+        table.add_column("Variable")
+        table.add_column("Change")
+        table.add_column("Left")
+        table.add_column("Right")
+        for entry in entries:
+            table.add_row(
+                entry.variable,
+                badge_text,
+                entry.redacted_left() or "",
+                entry.redacted_right() or "",
+            )
+        console.print(table)
+    console.print(
+        _format_counts_summary(
+            report,
+            sections=sections,
+            labels=_DIFF_KIND_LABELS,
+            top_limit=top_limit,
+        ),
+    )
+    console.print(f"Total differences: {report.change_count}")
@@ -4,8 +4,6 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from ._compat import tomllib
-
 
 @dataclass(slots=True)
 class Config:
@@ -48,6 +46,8 @@ def load_config() -> Config:
     if not pyproject_path:
         return Config()
 
+    from ._compat import tomllib
+
     try:
         with pyproject_path.open("rb") as f:
             data = tomllib.load(f)
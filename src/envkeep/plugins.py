@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import functools
 import logging
-from importlib.metadata import entry_points
+from importlib.metadata import EntryPoint, entry_points
 from typing import Protocol, runtime_checkable
 
 logger = logging.getLogger(__name__)
@@ -30,15 +31,20 @@ class Backend(Protocol):
         ...  # pragma: no cover
 
 
+@functools.cache
+def _backend_entry_points() -> tuple[EntryPoint, ...]:
+    """Scan installed distributions for backend entry points once per process."""
+    return tuple(entry_points(group="envkeep.backends"))
+
+
 def load_backends() -> dict[str, Backend]:
     """Discover and load all installed backend plugins."""
     backends: dict[str, Backend] = {}
-    for entry_point in entry_points(group="envkeep.backends"):
+    for entry_point in _backend_entry_points():
         try:
             backend_instance = entry_point.load()()
-            if isinstance(backend_instance, Backend) and callable(
-                getattr(backend_instance, "fetch", None),
-            ):
+            # A callable ``fetch`` is everything the runtime Protocol check would verify
+            if callable(getattr(backend_instance, "fetch", None)):
                 backends[entry_point.name] = backend_instance
         except Exception:
             logger.exception("Failed to load plugin: %s", entry_point.name)
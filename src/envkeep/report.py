@@ -5,11 +5,15 @@ from collections import Counter
 from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass, field
 from enum import Enum
+from operator import attrgetter
 from types import MappingProxyType
 from typing import Any
 
 from .utils import casefold_sorted, line_number_sort_key, normalized_limit, sorted_counter
 
+_VARIABLE = attrgetter("variable")
+_INVALID_LINE_CELLS = attrgetter("variable", "hint", "message")
+
 
 class IssueSeverity(str, Enum):
     """Represents the severity of a validation issue."""
@@ -149,11 +153,8 @@ class ValidationReport:
     def __iter__(self) -> Iterator[ValidationIssue]:  # pragma: no cover - trivial
         return iter(self.issues)
 
-    def _invalidate_issue_caches(self, issue: ValidationIssue) -> None:
-        self._severity_variable_cache.pop(issue.severity, None)
-        self._sorted_severity_cache.pop(issue.severity, None)
-        self._sorted_code_cache.pop(issue.code, None)
-        self._sorted_variable_cache.pop(issue.variable, None)
+    def _reset_aggregate_caches(self) -> None:
+        """Drop every report-wide cache; keyed caches are handled by the callers."""
         self._counts_by_code_cache = None
         self._counts_by_code_mapping = None
         self._variables_cache = None
@@ -162,6 +163,20 @@ class ValidationReport:
         self._top_variables_cache = None
         self._most_common_codes_cache = None
 
+    def _invalidate_issue_caches(self, issue: ValidationIssue) -> None:
+        self._severity_variable_cache.pop(issue.severity, None)
+        self._sorted_severity_cache.pop(issue.severity, None)
+        self._sorted_code_cache.pop(issue.code, None)
+        self._sorted_variable_cache.pop(issue.variable, None)
+        self._reset_aggregate_caches()
+
+    def _invalidate_all_caches(self) -> None:
+        self._severity_variable_cache.clear()
+        self._sorted_severity_cache.clear()
+        self._sorted_code_cache.clear()
+        self._sorted_variable_cache.clear()
+        self._reset_aggregate_caches()
+
     def _track_issue(self, issue: ValidationIssue) -> None:
         self._severity_counts[issue.severity] += 1
         self._code_counts[issue.code] += 1
@@ -170,16 +185,20 @@ class ValidationReport:
         self._code_buckets.setdefault(issue.code, []).append(issue)
         self._variable_buckets.setdefault(issue.variable, []).append(issue)
         self._severity_variables[issue.severity].add(issue.variable)
-        self._invalidate_issue_caches(issue)
 
     def add(self, issue: ValidationIssue) -> None:
         self.issues.append(issue)
         self._track_issue(issue)
+        self._invalidate_issue_caches(issue)
 
     def extend(self, issues: Iterable[ValidationIssue]) -> None:
+        added = len(self.issues)
         for issue in issues:
             self.issues.append(issue)
             self._track_issue(issue)
+        # Caches only rebuild on read, so a batch needs one reset rather than one per issue
+        if len(self.issues) != added:
+            self._invalidate_all_caches()
 
     def severity_totals(self) -> dict[str, int]:
         return {
@@ -196,7 +215,13 @@ class ValidationReport:
             self._counts_by_code_mapping = MappingProxyType(dict(self._counts_by_code_cache))
         return self._counts_by_code_mapping
 
+    def counts_by_variable(self) -> Mapping[str, int]:
+        """Return a read-only live view of issue counts per variable, in insertion order."""
+        return MappingProxyType(self._variable_counts)
+
     def most_common_codes(self, limit: int | None = None) -> list[tuple[str, int]]:
+        if limit == 0:
+            return []
         if self._most_common_codes_cache is None:
             self._most_common_codes_cache = sorted_counter(self._code_counts)
         if limit is not None:
@@ -243,12 +268,12 @@ class ValidationReport:
         return computed
 
     def top_variables(self, limit: int | None = None) -> Sequence[tuple[str, int]]:
+        if limit == 0:
+            return []  # --summary-top 0: skip ranking entirely
         if self._top_variables_cache is None:
             self._top_variables_cache = tuple(sorted_counter(self._variable_counts))
         if limit is None:
             return list(self._top_variables_cache)
-        if limit == 0:
-            return []
         return list(self._top_variables_cache[:limit])
 
     def non_empty_severities(self) -> tuple[IssueSeverity, ...]:
@@ -259,13 +284,8 @@ class ValidationReport:
         )
         return tuple(severity for severity in order if self._severity_counts.get(severity, 0) > 0)
 
-    def to_dict(self, *, top_limit: int | None = None) -> dict[str, Any]:
-        limit = normalized_limit(top_limit)
+    def _aggregate_fields(self, limit: int | None) -> dict[str, Any]:
         return {
-            "is_success": self.is_success,
-            "error_count": self.error_count,
-            "warning_count": self.warning_count,
-            "issue_count": self.issue_count,
             "severity_totals": self.severity_totals(),
             "codes": dict(self.counts_by_code()),
             "most_common_codes": self.most_common_codes(limit),
@@ -273,8 +293,33 @@ class ValidationReport:
             "variables": list(self.variables()),
             "variables_by_severity": self.variables_by_severity(),
             "top_variables": self.top_variables(limit),
+        }
+
+    def to_dict(
+        self,
+        *,
+        top_limit: int | None = None,
+        include_summary: bool = False,
+    ) -> dict[str, Any]:
+        """Serialize the report, optionally as ``{"report": ..., "summary": ...}``.
+
+        With ``include_summary`` the aggregates are computed once; the summary
+        section gets its own copies, matching separate ``to_dict``/``summary`` calls.
+        """
+
+        limit = normalized_limit(top_limit)
+        aggregates = self._aggregate_fields(limit)
+        payload = {
+            "is_success": self.is_success,
+            "error_count": self.error_count,
+            "warning_count": self.warning_count,
+            "issue_count": self.issue_count,
+            **aggregates,
             "issues": [issue.to_dict() for issue in self.issues],
         }
+        if not include_summary:
+            return payload
+        return {"report": payload, "summary": self._summary_payload(_copy_aggregates(aggregates))}
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ValidationReport:
@@ -291,33 +336,40 @@ class ValidationReport:
         return cls(issues=issues)
 
     def summary(self, *, top_limit: int | None = None) -> dict[str, Any]:
-        limit = normalized_limit(top_limit)
+        return self._summary_payload(self._aggregate_fields(normalized_limit(top_limit)))
+
+    def _summary_payload(self, aggregates: dict[str, Any]) -> dict[str, Any]:
         return {
             "is_success": self.is_success,
             "has_errors": self.has_errors,
             "has_warnings": self.has_warnings,
             "has_info": self.has_info,
             "issue_count": self.issue_count,
-            "severity_totals": self.severity_totals(),
-            "codes": dict(self.counts_by_code()),
-            "most_common_codes": self.most_common_codes(limit),
-            "non_empty_severities": [severity.value for severity in self.non_empty_severities()],
-            "variables": list(self.variables()),
-            "variables_by_severity": self.variables_by_severity(),
-            "top_variables": self.top_variables(limit),
+            **aggregates,
         }
 
     def issues_by_severity(self, severity: IssueSeverity) -> list[ValidationIssue]:
+        return [*self._sorted_severity_bucket(severity)]
+
+    def issue_sections(self) -> tuple[tuple[IssueSeverity, tuple[ValidationIssue, ...]], ...]:
+        """Return ``(severity, issues)`` for each non-empty severity in display order."""
+
+        return tuple(
+            (severity, self._sorted_severity_bucket(severity))
+            for severity in self.non_empty_severities()
+        )
+
+    def _sorted_severity_bucket(self, severity: IssueSeverity) -> tuple[ValidationIssue, ...]:
         cached = self._sorted_severity_cache.get(severity)
         if cached is not None:
-            return [*cached]
+            return cached
         bucket = self._severity_buckets.get(severity)
         if not bucket:
             self._sorted_severity_cache[severity] = ()
-            return []
+            return ()
         sorted_bucket = tuple(sorted(bucket, key=self._issue_sort_key))
         self._sorted_severity_cache[severity] = sorted_bucket
-        return [*sorted_bucket]
+        return sorted_bucket
 
     def issues_by_code(self, code: str) -> list[ValidationIssue]:
         return [*self._sorted_code_bucket(code)]
@@ -349,20 +401,21 @@ class ValidationReport:
     def warning_summary(self) -> dict[str, Any]:
         cached = self._warning_summary_cache
         if cached is None:
-            duplicate_issues = self._sorted_code_bucket("duplicate")
-            extra_issues = self._sorted_code_bucket("extra")
-            invalid_line_issues = self._sorted_code_bucket("invalid_line")
+            # Only the names matter here, so the unsorted buckets feed the sets directly
             duplicates = tuple(
-                casefold_sorted({issue.variable for issue in duplicate_issues}),
+                casefold_sorted(set(map(_VARIABLE, self._code_buckets.get("duplicate", ())))),
             )
             extras = tuple(
-                casefold_sorted({issue.variable for issue in extra_issues}),
+                casefold_sorted(set(map(_VARIABLE, self._code_buckets.get("extra", ())))),
             )
             invalid_lines = tuple(
                 sorted(
                     (
-                        (issue.variable, issue.hint or issue.message)
-                        for issue in invalid_line_issues
+                        (line, hint or message)
+                        for line, hint, message in map(
+                            _INVALID_LINE_CELLS,
+                            self._sorted_code_bucket("invalid_line"),
+                        )
                     ),
                     key=lambda item: line_number_sort_key(item[0]),
                 ),
@@ -484,19 +537,43 @@ class DiffReport:
         self.entries.append(entry)
         self._track_entry(entry)
 
-    def to_dict(self, *, top_limit: int | None = None) -> dict[str, Any]:
-        limit = normalized_limit(top_limit)
+    def _aggregate_fields(self, limit: int | None) -> dict[str, Any]:
         return {
-            "change_count": self.change_count,
-            "is_clean": self.is_clean(),
             "by_kind": dict(self.counts_by_kind()),
-            "entries": [entry.to_dict() for entry in self.entries],
             "variables": list(self.variables()),
             "top_variables": self.top_variables(limit),
             "variables_by_kind": self.variables_by_kind(),
             "non_empty_kinds": [kind.value for kind in self.non_empty_kinds()],
         }
 
+    def to_dict(
+        self,
+        *,
+        top_limit: int | None = None,
+        include_summary: bool = False,
+    ) -> dict[str, Any]:
+        """Serialize the report, optionally as ``{"report": ..., "summary": ...}``.
+
+        With ``include_summary`` the aggregates are computed once; the summary
+        section gets its own copies, matching separate ``to_dict``/``summary`` calls.
+        """
+
+        limit = normalized_limit(top_limit)
+        aggregates = self._aggregate_fields(limit)
+        payload = {
+            "change_count": self.change_count,
+            "is_clean": self.is_clean(),
+            "by_kind": aggregates["by_kind"],
+            "entries": [entry.to_dict() for entry in self.entries],
+            "variables": aggregates["variables"],
+            "top_variables": aggregates["top_variables"],
+            "variables_by_kind": aggregates["variables_by_kind"],
+            "non_empty_kinds": aggregates["non_empty_kinds"],
+        }
+        if not include_summary:
+            return payload
+        return {"report": payload, "summary": self._summary_payload(_copy_aggregates(aggregates))}
+
     def sorted_entries(self) -> list[DiffEntry]:
         cached = self._sorted_entries_cache
         if cached is not None:
@@ -516,13 +593,21 @@ class DiffReport:
         return [*sorted_entries]
 
     def entries_by_kind(self, kind: DiffKind) -> list[DiffEntry]:
+        return [*self._sorted_kind_bucket(kind)]
+
+    def entry_sections(self) -> tuple[tuple[DiffKind, tuple[DiffEntry, ...]], ...]:
+        """Return ``(kind, entries)`` for each non-empty kind in display order."""
+
+        return tuple((kind, self._sorted_kind_bucket(kind)) for kind in self.non_empty_kinds())
+
+    def _sorted_kind_bucket(self, kind: DiffKind) -> tuple[DiffEntry, ...]:
         cached = self._sorted_kind_cache.get(kind)
         if cached is not None:
-            return [*cached]
+            return cached
         bucket = self._kind_buckets.get(kind)
         if not bucket:
             self._sorted_kind_cache[kind] = ()
-            return []
+            return ()
         sorted_bucket = tuple(
             sorted(
                 bucket,
@@ -530,7 +615,7 @@ class DiffReport:
             ),
         )
         self._sorted_kind_cache[kind] = sorted_bucket
-        return [*sorted_bucket]
+        return sorted_bucket
 
     def count_for(self, kind: DiffKind) -> int:
         return self._counts.get(kind, 0)
@@ -556,12 +641,12 @@ class DiffReport:
         return variable in self._variable_counts
 
     def top_variables(self, limit: int | None = None) -> Sequence[tuple[str, int]]:
+        if limit == 0:
+            return []  # --summary-top 0: skip ranking entirely
         if self._top_variables_cache is None:
             self._top_variables_cache = tuple(sorted_counter(self._variable_counts))
         if limit is None:
             return list(self._top_variables_cache)
-        if limit == 0:
-            return []
         return list(self._top_variables_cache[:limit])
 
     def variables_by_kind(self) -> dict[str, list[str]]:
@@ -580,18 +665,38 @@ class DiffReport:
         return self._counts_by_kind_mapping
 
     def summary(self, *, top_limit: int | None = None) -> dict[str, Any]:
-        limit = normalized_limit(top_limit)
+        return self._summary_payload(self._aggregate_fields(normalized_limit(top_limit)))
+
+    def _summary_payload(self, aggregates: dict[str, Any]) -> dict[str, Any]:
         return {
             "change_count": self.change_count,
             "is_clean": self.is_clean(),
-            "by_kind": dict(self.counts_by_kind()),
-            "non_empty_kinds": [kind.value for kind in self.non_empty_kinds()],
-            "variables": list(self.variables()),
-            "top_variables": self.top_variables(limit),
-            "variables_by_kind": self.variables_by_kind(),
+            "by_kind": aggregates["by_kind"],
+            "non_empty_kinds": aggregates["non_empty_kinds"],
+            "variables": aggregates["variables"],
+            "top_variables": aggregates["top_variables"],
+            "variables_by_kind": aggregates["variables_by_kind"],
         }
 
 
+def _copy_aggregates(aggregates: dict[str, Any]) -> dict[str, Any]:
+    """Return ``aggregates`` with fresh dicts and lists, including lists held in a dict.
+
+    The leaves are strings, ints and tuples, so two payload sections built from
+    the same aggregates then share no mutable object.
+    """
+    copied: dict[str, Any] = {}
+    for key, value in aggregates.items():
+        if isinstance(value, dict):
+            value = {
+                name: [*item] if isinstance(item, list) else item for name, item in value.items()
+            }
+        elif isinstance(value, list):
+            value = [*value]
+        copied[key] = value
+    return copied
+
+
 def _redact(value: str | None) -> str | None:
     if value is None:
         return None
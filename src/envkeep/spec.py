@@ -250,6 +250,13 @@ class EnvSpec:
     def __post_init__(self) -> None:
         self._rebuild_caches()
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Lookup caches are read-only proxies that cannot be pickled; rebuild them on load
+        return (
+            type(self),
+            (self.version, self.variables, self.profiles, self.metadata, self.imports),
+        )
+
     @classmethod
     def from_file(cls, path: str | Path) -> EnvSpec:
         path_obj = Path(path)
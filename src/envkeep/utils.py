@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 # Shared helper utilities for envkeep modules.
+import re
 from collections import Counter
 from collections.abc import Iterable
+from operator import itemgetter
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -27,13 +29,19 @@ def normalized_limit(limit: int | None) -> int | None:
 def casefold_sorted(values: Iterable[str]) -> list[str]:
     """Return values sorted deterministically with casefold ordering."""
 
-    return sorted(values, key=lambda item: (item.casefold(), item))
+    # Two stable passes with C-level keys order by (casefold, item) without tuple keys
+    items = sorted(values)
+    items.sort(key=str.casefold)
+    return items
 
 
 def sorted_counter(counter: Counter[str]) -> list[tuple[str, int]]:
     """Return counter contents sorted by frequency (desc) then name."""
 
-    return sorted(counter.items(), key=lambda item: (-item[1], item[0]))
+    # Name first, then a stable descending count pass; avoids a Python key lambda
+    items = sorted(counter.items(), key=itemgetter(0))
+    items.sort(key=itemgetter(1), reverse=True)
+    return items
 
 
 def resolve_optional_path_option(
@@ -56,10 +64,13 @@ def strip_bom(text: str) -> str:
     return text
 
 
+_DIGIT_RUNS = re.compile(r"\d+")
+
+
 def line_number_sort_key(value: str) -> tuple[int, str]:
     """Return a sortable key that prefers embedded digits when present."""
 
-    digits = "".join(char for char in value if char.isdigit())
+    digits = "".join(_DIGIT_RUNS.findall(value))
     number = int(digits) if digits else 0
     return number, value
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import sys
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -26,3 +28,16 @@ def patch_config(monkeypatch: pytest.MonkeyPatch, mock_config: Config) -> MagicM
 def patch_console_width(monkeypatch: pytest.MonkeyPatch) -> None:
     """Patch the console width to prevent truncation in tests."""
     monkeypatch.setattr("envkeep.cli.console.width", 1000)
+
+
+@pytest.fixture  # type: ignore[misc]
+def hide_orjson(monkeypatch: pytest.MonkeyPatch) -> Iterator[Callable[[], None]]:
+    """Return a callable that makes ``orjson`` unimportable for the rest of the test."""
+    from envkeep.cli import _orjson
+
+    def hide() -> None:
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        _orjson.cache_clear()
+
+    yield hide
+    _orjson.cache_clear()
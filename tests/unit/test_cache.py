@@ -4,11 +4,15 @@ import shutil
 import textwrap
 import time
 from pathlib import Path
+from typing import Any
 
 import pytest
 from typer.testing import CliRunner
 
+from envkeep import cache as cache_module
 from envkeep.cli import app
+from envkeep.report import ValidationReport
+from envkeep.spec import EnvSpec
 
 runner = CliRunner()
 
@@ -70,3 +74,122 @@ def test_doctor_cache_hit_and_miss(tmp_path: Path, monkeypatch: pytest.MonkeyPat
     result5 = runner.invoke(app, ["doctor", "--no-cache"])
     assert result5.exit_code == 0
     assert not cache_dir.exists()
+
+
+def test_cache_hashes_spec_once_per_instance(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    spec_file = tmp_path / "envkeep.toml"
+    spec_file.write_text("version = 1\n", encoding="utf-8")
+    env_files = [tmp_path / f"{name}.env" for name in ("a", "b")]
+    for index, env_file in enumerate(env_files):
+        env_file.write_text(f"VALUE={index}\n", encoding="utf-8")
+    hashed: list[Path] = []
+    original = cache_module._hash_file
+
+    def counting_hash(path: Path) -> str:
+        hashed.append(path)
+        return original(path)
+
+    monkeypatch.setattr(cache_module, "_hash_file", counting_hash)
+    cache = cache_module.Cache(tmp_path / "cache")
+    for env_file in env_files:
+        assert cache.get_report(env_file, spec_file) is None
+        cache.set_report(env_file, spec_file, ValidationReport())
+        assert cache.get_report(env_file, spec_file) is not None
+    assert hashed.count(spec_file) == 1
+
+
+def test_cache_reads_and_writes_spec_hash_once_per_instance(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    spec_file = tmp_path / "envkeep.toml"
+    spec_file.write_text("version = 1\n", encoding="utf-8")
+    env_files = [tmp_path / f"{name}.env" for name in ("a", "b", "c")]
+    for index, env_file in enumerate(env_files):
+        env_file.write_text(f"VALUE={index}\n", encoding="utf-8")
+    cache = cache_module.Cache(tmp_path / "cache")
+    for env_file in env_files:
+        cache.set_report(env_file, spec_file, ValidationReport())
+
+    touched: list[str] = []
+    original_read = Path.read_text
+    original_write = cache_module._replace_text
+
+    def tracking_read(self: Path, *args: Any, **kwargs: Any) -> str:
+        touched.append(f"read:{self.name}")
+        return original_read(self, *args, **kwargs)
+
+    def tracking_write(path: Path, text: str) -> None:
+        touched.append(f"write:{path.name}")
+        original_write(path, text)
+
+    monkeypatch.setattr(Path, "read_text", tracking_read)
+    monkeypatch.setattr(cache_module, "_replace_text", tracking_write)
+    fresh = cache_module.Cache(tmp_path / "cache")
+    for env_file in env_files:
+        assert fresh.get_report(env_file, spec_file) is not None
+        fresh.set_report(env_file, spec_file, ValidationReport())
+    assert touched.count("read:spec.hash") == 1
+    assert touched.count("write:spec.hash") == 1
+
+
+def test_cache_report_writes_leave_no_partial_files(tmp_path: Path) -> None:
+    spec_file = tmp_path / "envkeep.toml"
+    spec_file.write_text("version = 1\n", encoding="utf-8")
+    env_file = tmp_path / ".env"
+    env_file.write_text("VALUE=1\n", encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+    cache = cache_module.Cache(cache_dir)
+    cache.set_report(env_file, spec_file, ValidationReport())
+    cache.set_report(env_file, spec_file, ValidationReport())
+    assert sorted(path.suffix for path in cache_dir.iterdir()) == [".hash", ".json"]
+    assert cache_module.Cache(cache_dir).get_report(env_file, spec_file) is not None
+
+
+def test_cache_treats_unreachable_profile_as_miss(
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    spec_file = tmp_path / "envkeep.toml"
+    spec_file.write_text("version = 1\n", encoding="utf-8")
+    env_file = tmp_path / ".env"
+    env_file.write_text("VALUE=1\n", encoding="utf-8")
+    cache = cache_module.Cache(tmp_path / "cache")
+    cache.set_report(env_file, spec_file, ValidationReport())
+    with caplog.at_level("WARNING", logger=cache_module.__name__):
+        assert cache.get_report(tmp_path / "missing.env", spec_file) is None
+        assert cache.get_report(env_file / "nested.env", spec_file) is None
+    assert caplog.records == []
+
+
+def test_spec_cache_round_trips_until_spec_changes(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    spec_file = tmp_path / "envkeep.toml"
+    shutil.copy(Path("examples/basic/envkeep.toml"), spec_file)
+    assert cache_module.load_cached_spec(spec_file) is None
+    spec = EnvSpec.from_file(spec_file)
+    cache_module.store_cached_spec(spec_file, spec)
+    cached = cache_module.load_cached_spec(spec_file)
+    assert cached is not None
+    assert cached == spec
+    assert cached.variable_map().keys() == spec.variable_map().keys()
+    spec_file.write_text(spec_file.read_text() + "\n# edited\n", encoding="utf-8")
+    assert cache_module.load_cached_spec(spec_file) is None
+
+
+def test_cli_uses_spec_cache_when_enabled(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    monkeypatch.setenv("ENVKEEP_SPEC_CACHE", "1")
+    spec_file = tmp_path / "envkeep.toml"
+    shutil.copy(Path("examples/basic/envkeep.toml"), spec_file)
+    args = ["check", "examples/basic/.env.dev", "--spec", str(spec_file)]
+    assert runner.invoke(app, args).exit_code == 0
+    assert list((tmp_path / "xdg" / "envkeep").glob("spec-*.pkl"))
+    monkeypatch.setattr(EnvSpec, "from_file", classmethod(lambda cls, path: pytest.fail("parsed")))
+    assert runner.invoke(app, args).exit_code == 0
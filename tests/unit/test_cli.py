@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import io
 import json
 import textwrap
+from collections.abc import Callable
 from pathlib import Path
 from unittest.mock import MagicMock
 
@@ -9,7 +11,7 @@ import pytest
 import typer
 from typer.testing import CliRunner
 
-from envkeep.cli import app
+from envkeep.cli import _read_stdin_once, _sniff_subcommand, app, run
 from envkeep.cli import check as cli_check
 from envkeep.cli import diff as cli_diff
 from envkeep.cli import doctor as cli_doctor
@@ -333,6 +335,25 @@ def test_cli_doctor_json_output(tmp_path: Path, patch_config: MagicMock) -> None
     assert payload["summary"]["profile_base_dir"] == str(spec_copy.parent.resolve())
 
 
+def test_cli_doctor_loads_config_once(
+    tmp_path: Path,
+    patch_config: MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    env_file = tmp_path / "dev.env"
+    env_file.write_text(DEV_ENV.read_text(), encoding="utf-8")
+    spec_text = (
+        EXAMPLE_SPEC.read_text()
+        .replace(".env.dev", str(env_file))
+        .replace(".env.prod", str(env_file))
+    )
+    (tmp_path / "envkeep.toml").write_text(spec_text, encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(app, ["doctor", "--format", "json"])
+    assert result.exit_code == 0
+    assert patch_config.call_count == 1
+
+
 def test_cli_doctor_fail_on_warnings(tmp_path: Path) -> None:
     env_file = tmp_path / "warn.env"
     env_file.write_text(
@@ -1161,3 +1182,290 @@ def test_cli_diff_json_output(tmp_path: Path) -> None:
     assert report_payload["by_kind"]["missing"] == 0
     assert report_payload["variables"] == ["ALLOWED_HOSTS", "API_TOKEN", "DATABASE_URL", "DEBUG"]
     assert report_payload["top_variables"][0][0] == "ALLOWED_HOSTS"
+
+
+def test_cli_streams_rows_above_threshold(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("envkeep.cli._render.STREAM_ROW_THRESHOLD", 0)
+    monkeypatch.setattr("envkeep.cli.console._force_terminal", True)
+    monkeypatch.setattr("envkeep.cli.console.no_color", True)
+    env_file = tmp_path / "warn.env"
+    env_file.write_text(DEV_ENV.read_text() + "\nEXTRA=value\n", encoding="utf-8")
+    result = runner.invoke(app, ["check", str(env_file), "--spec", str(EXAMPLE_SPEC)])
+    assert result.exit_code == 0
+    normalized_output = " ".join(result.stdout.split())
+    assert "WARNING EXTRA extra variable not declared in spec" in normalized_output
+    assert "│" not in result.stdout
+    assert "Warnings: 1" in result.stdout
+
+
+def test_cli_table_badges_style_only_the_label(monkeypatch: pytest.MonkeyPatch) -> None:
+    from rich.console import ColorSystem
+
+    monkeypatch.setattr("envkeep.cli.console._force_terminal", True)
+    monkeypatch.setattr("envkeep.cli.console._color_system", ColorSystem.STANDARD)
+    result = runner.invoke(app, ["check", "/dev/null", "--spec", str(EXAMPLE_SPEC)])
+    assert "│ \x1b[31mERROR\x1b[0m    │" in result.stdout
+    result = runner.invoke(app, ["diff", str(DEV_ENV), str(PROD_ENV), "--spec", str(EXAMPLE_SPEC)])
+    assert "│ \x1b[31mCHANGED\x1b[0m │" in result.stdout
+
+
+def test_cli_doctor_terminal_output_keeps_profile_order(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("envkeep.cli.console._force_terminal", True)
+    monkeypatch.setattr("envkeep.cli.console.no_color", True)
+    spec_text = EXAMPLE_SPEC.read_text().replace(".env.dev", str(DEV_ENV.resolve()))
+    spec_copy = tmp_path / "envkeep.toml"
+    spec_copy.write_text(spec_text, encoding="utf-8")
+    result = runner.invoke(app, ["doctor", "--spec", str(spec_copy), "--no-cache"])
+    markers = [
+        "Profile: development",
+        "All checks passed.",
+        "Profile production: missing env file",
+        "Doctor Summary",
+    ]
+    positions = [result.stdout.index(marker) for marker in markers]
+    assert positions == sorted(positions)
+
+
+def test_cli_check_plain_rows_when_not_a_terminal(tmp_path: Path) -> None:
+    env_file = tmp_path / "warn.env"
+    env_file.write_text(DEV_ENV.read_text() + "\nEXTRA=value\n", encoding="utf-8")
+    result = runner.invoke(app, ["check", str(env_file), "--spec", str(EXAMPLE_SPEC)])
+    assert result.exit_code == 0
+    assert "WARNING\tEXTRA\textra\tvariable not declared in spec\t" in result.stdout
+    assert "│" not in result.stdout
+    assert "Warnings: 1" in result.stdout
+
+
+def test_cli_diff_plain_rows_when_not_a_terminal() -> None:
+    result = runner.invoke(app, ["diff", str(DEV_ENV), str(PROD_ENV), "--spec", str(EXAMPLE_SPEC)])
+    assert result.exit_code == 1
+    assert "\tCHANGED\t" in result.stdout
+    assert "│" not in result.stdout
+
+
+def test_cli_plain_rows_escape_separators_in_cells(tmp_path: Path) -> None:
+    spec_file = tmp_path / "envkeep.toml"
+    spec_file.write_text('version = 1\n\n[[variables]]\nname = "NOTE"\n', encoding="utf-8")
+    left = tmp_path / "left.env"
+    left.write_text('NOTE="a\\tb\\r\\nc\\\\d"\n', encoding="utf-8")
+    right = tmp_path / "right.env"
+    right.write_text("NOTE=plain\n", encoding="utf-8")
+    result = runner.invoke(app, ["diff", str(left), str(right), "--spec", str(spec_file)])
+    assert "NOTE\tCHANGED\ta\\tb\\r\\nc\\\\d\tplain\n" in result.stdout
+
+
+def test_read_stdin_once_caches_per_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("sys.stdin", io.StringIO("FIRST=1\n"))
+    assert _read_stdin_once() == "FIRST=1\n"
+    assert _read_stdin_once() == "FIRST=1\n"
+    monkeypatch.setattr("sys.stdin", io.StringIO("SECOND=2\n"))
+    assert _read_stdin_once() == "SECOND=2\n"
+
+
+def test_read_stdin_once_decodes_binary_buffer(monkeypatch: pytest.MonkeyPatch) -> None:
+    raw = io.BytesIO("KEY=välue\r\nOTHER=1\r\n".encode())
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(raw, encoding="utf-8"))
+    assert _read_stdin_once() == "KEY=välue\nOTHER=1\n"
+
+
+def test_sniff_subcommand_limits_registration() -> None:
+    assert _sniff_subcommand(["--version"]) == ()
+    assert _sniff_subcommand(["check", ".env"]) == ("check",)
+    assert _sniff_subcommand(["--help"]) == ("check", "diff", "generate", "inspect", "doctor")
+    assert _sniff_subcommand([]) == ("check", "diff", "generate", "inspect", "doctor")
+
+
+def test_run_entry_point_handles_version_and_single_command(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    with pytest.raises(SystemExit) as excinfo:
+        run(["--version"])
+    assert excinfo.value.code == 0
+    assert "envkeep version" in capsys.readouterr().out
+    with pytest.raises(SystemExit) as excinfo:
+        run(["check", str(DEV_ENV), "--spec", str(EXAMPLE_SPEC)])
+    assert excinfo.value.code == 0
+    assert "All checks passed" in capsys.readouterr().out
+
+
+def test_cli_doctor_json_matches_without_orjson(hide_orjson: Callable[[], None]) -> None:
+    args = ["doctor", "--spec", str(EXAMPLE_SPEC), "--format", "json", "--no-cache"]
+    accelerated = runner.invoke(app, args)
+    hide_orjson()
+    fallback = runner.invoke(app, args)
+    assert accelerated.exit_code == fallback.exit_code
+    assert json.loads(accelerated.stdout) == json.loads(fallback.stdout)
+
+
+def test_cli_check_json_matches_without_orjson(hide_orjson: Callable[[], None]) -> None:
+    args = ["check", str(DEV_ENV), "--spec", str(EXAMPLE_SPEC), "--format", "json"]
+    accelerated = runner.invoke(app, args)
+    hide_orjson()
+    fallback = runner.invoke(app, args)
+    assert accelerated.exit_code == fallback.exit_code == 0
+    assert json.loads(accelerated.stdout) == json.loads(fallback.stdout)
+    assert fallback.stdout == json.dumps(json.loads(fallback.stdout), indent=2) + "\n"
+
+
+def test_cli_json_payloads_match_without_orjson_for_non_ascii(
+    tmp_path: Path,
+    hide_orjson: Callable[[], None],
+) -> None:
+    env_file = tmp_path / "ñ.env"
+    env_file.write_text("GRÜSSE=héllo\n", encoding="utf-8")
+    spec_file = tmp_path / "envkeep.toml"
+    spec_file.write_text(
+        "version = 1\n\n"
+        '[[variables]]\nname = "GREETING"\ndescription = "Begrüßung"\n\n'
+        '[[profiles]]\nname = "dév"\nenv_file = "ñ.env"\n',
+        encoding="utf-8",
+    )
+    spec = ["--spec", str(spec_file), "--format", "json"]
+    commands = [
+        ["check", str(env_file), *spec, "--no-cache"],
+        ["diff", str(env_file), str(DEV_ENV), *spec],
+        ["inspect", *spec],
+        ["doctor", *spec, "--no-cache"],
+    ]
+    accelerated = [runner.invoke(app, args).stdout for args in commands]
+    hide_orjson()
+    fallback = [runner.invoke(app, args).stdout for args in commands]
+    for fast, slow in zip(accelerated, fallback, strict=True):
+        assert json.loads(fast) == json.loads(slow)
+        assert slow.isascii()
+    assert "dév" in accelerated[3]
+    assert "d\\u00e9v" in fallback[3]
+
+
+def test_cli_doctor_json_stream_matches_buffered_layout(tmp_path: Path) -> None:
+    spec_text = EXAMPLE_SPEC.read_text().replace(".env.dev", str(DEV_ENV.resolve()))
+    spec_copy = tmp_path / "envkeep.toml"
+    spec_copy.write_text(spec_text, encoding="utf-8")
+    result = runner.invoke(app, ["doctor", "--spec", str(spec_copy), "--format", "json"])
+    payload = json.loads(result.stdout)
+    assert list(payload) == ["profiles", "allow_extra", "fail_on_warnings", "summary", "warnings"]
+    assert [item.get("error") for item in payload["profiles"]] == [None, "missing env file"]
+    assert result.stdout == json.dumps(payload, indent=2) + "\n"
+
+
+def test_cli_doctor_json_writes_nothing_when_first_profile_fails(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    spec_text = EXAMPLE_SPEC.read_text().replace(".env.dev", str(DEV_ENV.resolve()))
+    spec_copy = tmp_path / "envkeep.toml"
+    spec_copy.write_text(spec_text, encoding="utf-8")
+
+    def unreadable(cls: type, path: Path) -> None:
+        raise PermissionError(path)
+
+    monkeypatch.setattr(
+        "envkeep.cli._commands.doctor.EnvSnapshot.from_env_file",
+        classmethod(unreadable),
+    )
+    args = ["doctor", "--spec", str(spec_copy), "--format", "json", "--no-cache"]
+    result = runner.invoke(app, args)
+    assert isinstance(result.exception, PermissionError)
+    assert result.stdout == ""
+
+
+def test_cli_compact_json_output(tmp_path: Path, hide_orjson: Callable[[], None]) -> None:
+    spec_text = EXAMPLE_SPEC.read_text().replace(".env.dev", str(DEV_ENV.resolve()))
+    spec_copy = tmp_path / "envkeep.toml"
+    spec_copy.write_text(spec_text, encoding="utf-8")
+    check_args = ["check", str(DEV_ENV), "--spec", str(EXAMPLE_SPEC), "--format", "json"]
+    doctor_args = ["doctor", "--spec", str(spec_copy), "--format", "json", "--no-cache"]
+    outputs = [
+        runner.invoke(app, [*args, "--compact"]).stdout for args in (check_args, doctor_args)
+    ]
+    hide_orjson()
+    outputs += [
+        runner.invoke(app, [*args, "--compact"]).stdout for args in (check_args, doctor_args)
+    ]
+    for output in outputs:
+        assert output == json.dumps(json.loads(output), separators=(",", ":")) + "\n"
+    assert outputs[:2] == outputs[2:]
+
+
+def test_cli_doctor_text_summary_counts_issues_across_profiles(tmp_path: Path) -> None:
+    env_file = tmp_path / "broken.env"
+    env_file.write_text("DEBUG=maybe\nEXTRA=value\n", encoding="utf-8")
+    spec_text = (
+        EXAMPLE_SPEC.read_text()
+        .replace(".env.dev", str(env_file))
+        .replace(".env.prod", str(env_file))
+    )
+    spec_copy = tmp_path / "envkeep.toml"
+    spec_copy.write_text(spec_text, encoding="utf-8")
+    json_result = runner.invoke(app, ["doctor", "--spec", str(spec_copy), "--format", "json"])
+    summary = json.loads(json_result.stdout)["summary"]
+    text_result = runner.invoke(app, ["doctor", "--spec", str(spec_copy)])
+    errors = summary["severity_totals"]["error"]
+    assert errors > 0
+    assert f"Total errors: {errors}" in text_result.stdout
+    code, count = summary["most_common_codes"][0]
+    assert f"{code}({count})" in text_result.stdout
+
+
+def test_cli_doctor_keeps_spec_order_with_parallel_profiles(tmp_path: Path) -> None:
+    names = [f"p{index:02d}" for index in range(12)]
+    profile_blocks = []
+    for index, name in enumerate(names):
+        env_file = tmp_path / f"{name}.env"
+        if index % 3:
+            env_file.write_text(DEV_ENV.read_text(), encoding="utf-8")
+        profile_blocks.append(f'[[profiles]]\nname = "{name}"\nenv_file = "{env_file}"\n')
+    spec_text = EXAMPLE_SPEC.read_text().split("[[profiles]]")[0] + "\n".join(profile_blocks)
+    spec_copy = tmp_path / "envkeep.toml"
+    spec_copy.write_text(spec_text, encoding="utf-8")
+    result = runner.invoke(
+        app,
+        ["doctor", "--spec", str(spec_copy), "--format", "json", "--no-cache"],
+    )
+    payload = json.loads(result.stdout)
+    assert [item["profile"] for item in payload["profiles"]] == names
+    assert payload["summary"]["missing_profiles"] == 4
+    assert payload["summary"]["profiles_with_reports"] == 8
+
+
+def test_bounded_map_preserves_order_and_limits_in_flight() -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from envkeep.cli._commands.doctor import _bounded_map
+
+    submitted: list[int] = []
+
+    def work(value: int) -> int:
+        submitted.append(value)
+        return value * 2
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        results = _bounded_map(pool, work, range(10), window=3)
+        assert next(results) == 0
+        assert len(submitted) <= 3
+        assert list(results) == [value * 2 for value in range(1, 10)]
+
+
+def test_cli_doctor_treats_unreadable_paths_as_missing(tmp_path: Path) -> None:
+    (tmp_path / "not-a-dir").write_text("", encoding="utf-8")
+    (tmp_path / ".env.broken").symlink_to(tmp_path / "nowhere")
+    spec_path = tmp_path / "envkeep.toml"
+    spec_path.write_text(
+        "version = 1\n\n"
+        '[[profiles]]\nname = "nested"\nenv_file = "not-a-dir/.env"\n\n'
+        '[[profiles]]\nname = "broken"\nenv_file = ".env.broken"\n',
+        encoding="utf-8",
+    )
+    result = runner.invoke(
+        app,
+        ["doctor", "--spec", str(spec_path), "--format", "json", "--no-cache"],
+    )
+    assert result.exit_code == 1
+    payload = json.loads(result.stdout)
+    assert [item.get("error") for item in payload["profiles"]] == ["missing env file"] * 2
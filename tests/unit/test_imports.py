@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import subprocess
+import sys
 import textwrap
 from pathlib import Path
+from unittest.mock import MagicMock
 
-from envkeep.cli import load_spec
+from typer.testing import CliRunner
+
+from envkeep.cli import app, load_spec, load_spec_resolved
+from envkeep.snapshot import EnvSnapshot
 
 
 def test_spec_imports_merge_variables_and_profiles(tmp_path: Path) -> None:
@@ -106,3 +112,161 @@ def test_spec_imports_main_overrides_imported(tmp_path: Path) -> None:
     # Check that the main spec's profile definition overrides the imported one
     assert len(spec.profiles) == 1
     assert spec.profiles[0].env_file == ".env.main"
+
+
+def test_spec_imports_refresh_lookup_caches(tmp_path: Path) -> None:
+    first = tmp_path / "first.toml"
+    first.write_text(
+        textwrap.dedent(
+            """
+            version = 1
+            [[variables]]
+            name = "SHARED"
+
+            [[variables]]
+            name = "FIRST_VAR"
+            """,
+        ),
+        encoding="utf-8",
+    )
+    second = tmp_path / "second.toml"
+    second.write_text(
+        textwrap.dedent(
+            """
+            version = 1
+            [[variables]]
+            name = "SHARED"
+            description = "Second description"
+
+            [[profiles]]
+            name = "second_profile"
+            env_file = ".env.second"
+            """,
+        ),
+        encoding="utf-8",
+    )
+    main_spec_file = tmp_path / "envkeep.toml"
+    main_spec_file.write_text(
+        textwrap.dedent(
+            """
+            version = 1
+            imports = ["first.toml", "second.toml"]
+
+            [[variables]]
+            name = "MAIN_VAR"
+            """,
+        ),
+        encoding="utf-8",
+    )
+
+    spec = load_spec(main_spec_file)
+
+    assert [var.name for var in spec.variables] == ["MAIN_VAR", "SHARED", "FIRST_VAR"]
+    assert spec.variable_map()["SHARED"].description is None
+    assert set(spec.variable_names()) == {"MAIN_VAR", "SHARED", "FIRST_VAR"}
+    assert "second_profile" in spec.profiles_by_name()
+
+
+def test_cli_import_defers_command_modules() -> None:
+    probe = (
+        "import sys, envkeep.cli; "
+        "print(sorted(m for m in ('envkeep.cache', 'envkeep.snapshot', "
+        "'envkeep.cli._commands.check', 'envkeep.cli._render', 'rich.console', "
+        "'envkeep._compat') "
+        "if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_load_spec_resolved_skips_config_lookup(patch_config: MagicMock) -> None:
+    spec = load_spec_resolved(Path("examples/basic/envkeep.toml"))
+    assert spec.variables
+    patch_config.assert_not_called()
+
+
+def test_cli_json_output_skips_rich() -> None:
+    probe = (
+        "import sys\n"
+        "from envkeep.cli import run\n"
+        "try:\n"
+        "    run(['check', 'examples/basic/.env.dev', '--spec', 'examples/basic/envkeep.toml',"
+        " '--format', 'json'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(sorted(m for m in ('rich.console', 'rich.table') if m in sys.modules),"
+        " file=sys.stderr)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert result.stderr.strip().splitlines()[-1] == "[]"
+
+
+def test_version_fast_path_skips_cli_stack() -> None:
+    probe = (
+        "import sys\n"
+        "from envkeep.__main__ import main\n"
+        "main(['--version'])\n"
+        "print(sorted(m for m in ('typer', 'envkeep.cli') if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    version_line, loaded = result.stdout.strip().splitlines()
+    assert version_line.startswith("envkeep version: ")
+    assert loaded == "[]"
+
+
+def test_spec_imports_are_validated_and_selectable(tmp_path: Path) -> None:
+    (tmp_path / "imports.toml").write_text(
+        textwrap.dedent(
+            """
+            version = 1
+            [[variables]]
+            name = "IMPORTED_VAR"
+
+            [[profiles]]
+            name = "imported_profile"
+            env_file = ".env.imported"
+            """,
+        ),
+        encoding="utf-8",
+    )
+    main_spec_file = tmp_path / "envkeep.toml"
+    main_spec_file.write_text(
+        textwrap.dedent(
+            """
+            version = 1
+            imports = ["imports.toml"]
+
+            [[variables]]
+            name = "MAIN_VAR"
+            """,
+        ),
+        encoding="utf-8",
+    )
+    (tmp_path / ".env.imported").write_text("MAIN_VAR=1\n", encoding="utf-8")
+
+    spec = load_spec(main_spec_file)
+    missing = spec.validate(EnvSnapshot.from_text("MAIN_VAR=1\n"))
+    assert [issue.variable for issue in missing.issues] == ["IMPORTED_VAR"]
+    assert missing.issues[0].code == "missing"
+    assert spec.validate(EnvSnapshot.from_text("MAIN_VAR=1\nIMPORTED_VAR=2\n")).is_success
+
+    args = ["doctor", "--spec", str(main_spec_file), "--profile", "imported_profile"]
+    result = CliRunner().invoke(app, [*args, "--profile-base", str(tmp_path), "--no-cache"])
+    assert result.exit_code == 1
+    assert "Profile: imported_profile" in result.stdout
+    assert "IMPORTED_VAR" in result.stdout
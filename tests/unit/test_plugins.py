@@ -71,3 +71,44 @@ def test_plugin_discovery_and_fetching(tmp_path: Path, monkeypatch: pytest.Monke
     assert result_fail.exit_code == 1
     assert "REMOTE_VAR" in result_fail.stdout
     assert "invalid" in result_fail.stdout
+
+
+def test_check_skips_plugin_discovery_without_sources(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    env_file = tmp_path / ".env"
+    env_file.write_text("LOCAL_VAR=local_value\n", encoding="utf-8")
+    spec_file = tmp_path / "envkeep.toml"
+    spec_file.write_text(
+        'version = 1\n\n[[variables]]\nname = "LOCAL_VAR"\ntype = "string"\n',
+        encoding="utf-8",
+    )
+
+    def fail() -> None:
+        raise AssertionError("plugins should not load for a spec without sources")
+
+    monkeypatch.setattr("envkeep.cli._commands.check.load_backends", fail)
+    result = runner.invoke(app, ["check", str(env_file), "--no-cache"])
+    assert result.exit_code == 0
+    assert "All checks passed" in result.stdout
+
+
+def test_backend_entry_points_are_scanned_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    from envkeep import plugins
+
+    calls: list[str] = []
+
+    def fake_entry_points(*, group: str) -> list[object]:
+        calls.append(group)
+        return []
+
+    plugins._backend_entry_points.cache_clear()
+    monkeypatch.setattr(plugins, "entry_points", fake_entry_points)
+    try:
+        assert plugins.load_backends() == {}
+        assert plugins.load_backends() == {}
+    finally:
+        plugins._backend_entry_points.cache_clear()
+    assert calls == ["envkeep.backends"]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from envkeep.report import (
     DiffEntry,
     DiffKind,
@@ -443,3 +445,167 @@ def test_counts_by_kind_is_read_only() -> None:
     assert mapping[DiffKind.EXTRA.value] == 1
     mapping[DiffKind.EXTRA.value] = 0
     assert mapping[DiffKind.EXTRA.value] == 0
+
+
+def test_report_sections_follow_display_order() -> None:
+    report = ValidationReport(
+        issues=[
+            ValidationIssue(variable="b", message="warn", severity=IssueSeverity.WARNING, code="x"),
+            ValidationIssue(variable="A", message="warn", severity=IssueSeverity.WARNING, code="x"),
+        ],
+    )
+    diff = DiffReport(
+        entries=[
+            DiffEntry(variable="b", kind=DiffKind.EXTRA, left=None, right="1", secret=False),
+            DiffEntry(variable="A", kind=DiffKind.EXTRA, left=None, right="2", secret=False),
+        ],
+    )
+    assert [
+        (kind, [entry.variable for entry in group]) for kind, group in diff.entry_sections()
+    ] == [
+        (DiffKind.EXTRA, ["A", "b"]),
+    ]
+    sections = report.issue_sections()
+    assert [(severity, [issue.variable for issue in issues]) for severity, issues in sections] == [
+        (IssueSeverity.WARNING, ["A", "b"]),
+    ]
+
+
+def test_to_dict_include_summary_matches_separate_calls() -> None:
+    report = ValidationReport(
+        issues=[
+            ValidationIssue(variable="A", message="boom", severity=IssueSeverity.ERROR, code="x"),
+            ValidationIssue(variable="B", message="warn", severity=IssueSeverity.WARNING, code="y"),
+        ],
+    )
+    combined = report.to_dict(top_limit=1, include_summary=True)
+    assert combined == {
+        "report": report.to_dict(top_limit=1),
+        "summary": report.summary(top_limit=1),
+    }
+    diff = DiffReport(
+        entries=[
+            DiffEntry(variable="A", kind=DiffKind.EXTRA, left=None, right="1", secret=False),
+            DiffEntry(variable="B", kind=DiffKind.CHANGED, left="1", right="2", secret=True),
+        ],
+    )
+    combined_diff = diff.to_dict(top_limit=1, include_summary=True)
+    assert combined_diff == {
+        "report": diff.to_dict(top_limit=1),
+        "summary": diff.summary(top_limit=1),
+    }
+    assert list(combined_diff["summary"]) == list(diff.summary())
+
+
+def test_to_dict_include_summary_sections_share_no_containers() -> None:
+    report = ValidationReport(
+        issues=[
+            ValidationIssue(variable="A", message="boom", severity=IssueSeverity.ERROR, code="x"),
+        ],
+    )
+    diff = DiffReport(
+        entries=[
+            DiffEntry(variable="A", kind=DiffKind.EXTRA, left=None, right="1", secret=False),
+        ],
+    )
+    for combined in (report.to_dict(include_summary=True), diff.to_dict(include_summary=True)):
+        body, summary = combined["report"], combined["summary"]
+        for key, value in summary.items():
+            if isinstance(value, list | dict):
+                assert value is not body[key]
+            if isinstance(value, dict):
+                for name, item in value.items():
+                    if isinstance(item, list):
+                        assert item is not body[key][name]
+        body["variables"].append("MUTATED")
+        assert summary["variables"] == ["A"]
+
+
+def test_counts_by_variable_is_read_only_view() -> None:
+    report = ValidationReport(
+        issues=[
+            ValidationIssue(
+                variable="B",
+                message="boom",
+                severity=IssueSeverity.ERROR,
+                code="missing",
+            ),
+            ValidationIssue(
+                variable="A",
+                message="note",
+                severity=IssueSeverity.INFO,
+                code="note",
+            ),
+            ValidationIssue(
+                variable="B",
+                message="warn",
+                severity=IssueSeverity.WARNING,
+                code="extra",
+            ),
+        ],
+    )
+    counts = report.counts_by_variable()
+    assert dict(counts) == {"B": 2, "A": 1}
+    with pytest.raises(TypeError):
+        counts["A"] = 5  # type: ignore[index]
+
+
+def test_zero_top_limit_skips_ranking(monkeypatch: pytest.MonkeyPatch) -> None:
+    report = ValidationReport(
+        issues=[
+            ValidationIssue(
+                variable="A",
+                message="boom",
+                severity=IssueSeverity.ERROR,
+                code="missing",
+            ),
+        ],
+    )
+    diff = DiffReport(
+        entries=[
+            DiffEntry(variable="A", kind=DiffKind.EXTRA, left=None, right="1", secret=False),
+        ],
+    )
+
+    def fail(*_: object) -> None:
+        raise AssertionError("ranking computed for top_limit=0")
+
+    monkeypatch.setattr("envkeep.report.sorted_counter", fail)
+    payload = report.to_dict(top_limit=0, include_summary=True)
+    assert payload["summary"]["top_variables"] == []
+    assert payload["summary"]["most_common_codes"] == []
+    assert diff.summary(top_limit=0)["top_variables"] == []
+
+
+def test_extend_after_reads_refreshes_cached_views() -> None:
+    report = ValidationReport()
+    report.add(
+        ValidationIssue(
+            variable="FOO",
+            message="not declared",
+            severity=IssueSeverity.WARNING,
+            code="extra",
+        ),
+    )
+    assert report.warning_summary()["extra_variables"] == ["FOO"]
+    assert report.top_variables() == [("FOO", 1)]
+    assert [issue.variable for issue in report.issues_by_severity(IssueSeverity.WARNING)] == [
+        "FOO",
+    ]
+    report.extend(
+        ValidationIssue(
+            variable=name,
+            message="not declared",
+            severity=IssueSeverity.WARNING,
+            code="extra",
+        )
+        for name in ("BAR", "BAR")
+    )
+    assert report.warning_summary()["extra_variables"] == ["BAR", "FOO"]
+    assert report.top_variables() == [("BAR", 2), ("FOO", 1)]
+    assert report.counts_by_code() == {"extra": 3}
+    assert [issue.variable for issue in report.issues_by_severity(IssueSeverity.WARNING)] == [
+        "BAR",
+        "BAR",
+        "FOO",
+    ]